@@ -1,5 +1,8 @@
+import functools
 import logging
+import math
 
+import numba
 import numpy as np
 
 from process.blanket_library import dshellarea, eshellarea
@@ -27,7 +30,14 @@ class Build:
     def __init__(self):
         self.outfile = constants.nout
         self.mfile = constants.mfile
-        self.ripflag = AnnotatedVariable(int, 0)
+        self.ripflag = AnnotatedVariable(
+            int,
+            0,
+            docstring="TF ripple fit range of applicability flag: 0 within range, "
+            "1 winding pack to inter-coil length ratio, 2 number of TF coils, "
+            "3 plasma edge to TF coil leg radius ratio outside fitted range",
+            units="",
+        )
 
     def portsz(self):
         """Port size calculation
@@ -41,66 +51,89 @@ class Build:
         <P><LI>rtanmax : Maximum possible tangency radius (m) </UL>
         A User's Guide to the PROCESS Systems Code
         """
-        current_drive_variables.rtanbeam = (
-            current_drive_variables.frbeam * physics_variables.rmajor
+        (
+            current_drive_variables.rtanbeam,
+            rtanmax,
+            g,
+            c,
+            a_finite,
+            b_finite,
+            d_finite,
+        ) = self._portsz_cached(
+            float(current_drive_variables.frbeam),
+            float(physics_variables.rmajor),
+            float(tfcoil_variables.n_tf_coils),
+            float(tfcoil_variables.tftort),
+            float(build_variables.dr_tf_outboard),
+            float(current_drive_variables.beamwd),
+            float(current_drive_variables.nbshield),
+            float(build_variables.r_tf_outboard_mid),
         )
 
-        #  Toroidal angle between adjacent TF coils
-
-        omega = constants.twopi / tfcoil_variables.n_tf_coils
+        # Logged here rather than in the cached geometry so that every
+        # evaluation with a kludged dimension is reported
+        if not a_finite:
+            logger.error("a is inf. Kludging to 1e10.")
+        if not b_finite:
+            logger.error("b is inf. Kludging to 1e10.")
+        if not d_finite:
+            logger.error("d is inf. Kludging to 1e10.")
 
-        #  Half-width of outboard TF coil in toroidal direction (m)
-        a = 0.5e0 * tfcoil_variables.tftort  # (previously used inboard leg width)
-        try:
-            assert a < np.inf
-        except AssertionError:
-            logger.exception("a is inf. Kludging to 1e10.")
-            a = 1e10
-
-        #  Radial thickness of outboard TF coil leg (m)
-        b = build_variables.dr_tf_outboard
-        try:
-            assert b < np.inf
-        except AssertionError:
-            logger.exception("b is inf. Kludging to 1e10.")
-            b = 1e10
-
-        #  Width of beam duct, including shielding on both sides (m)
-        c = current_drive_variables.beamwd + 2.0e0 * current_drive_variables.nbshield
+        if g > c:
+            #  Maximum tangency radius for centreline of beam (m)
+            current_drive_variables.rtanmax = rtanmax
 
-        #  Major radius of inner edge of outboard TF coil (m)
-        d = build_variables.r_tf_outboard_mid - 0.5e0 * b
-        try:
-            assert d < np.inf
-        except AssertionError:
-            logger.exception("d is inf. Kludging to 1e10.")
-            d = 1e10
+        else:  # coil separation is too narrow for beam...
+            error_handling.fdiags[0] = g
+            error_handling.fdiags[1] = c
+            error_handling.report_error(63)
 
-        #  Refer to figure in User Guide for remaining geometric calculations
-        e = np.sqrt(a * a + (d + b) * (d + b))
-        f = np.sqrt(a * a + d * d)
+            current_drive_variables.rtanmax = 0.0e0
 
-        theta = omega - np.arctan(a / d)
-        phi = theta - np.arcsin(a / e)
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _portsz_cached(
+        frbeam,
+        rmajor,
+        n_tf_coils,
+        tftort,
+        dr_tf_outboard,
+        beamwd,
+        nbshield,
+        r_tf_outboard_mid,
+    ):
+        """Port size geometry, memoised on the (float) inputs of portsz
+
+        Returns the beam tangency radius, the maximum possible tangency
+        radius, the coil separation and beam duct width used to check
+        whether the beam fits between the TF coils, and whether each of the
+        dimensions a, b and d was finite (False where it was kludged).
+        """
+        rtanbeam = frbeam * rmajor
 
-        g = np.sqrt(e * e + f * f - 2.0e0 * e * f * np.cos(phi))  # cosine rule
+        #  Half-width of outboard TF coil in toroidal direction (m)
+        a = 0.5e0 * tftort  # (previously used inboard leg width)
 
-        if g > c:
-            h = np.sqrt(g * g - c * c)
+        #  Radial thickness of outboard TF coil leg (m)
+        b = dr_tf_outboard
 
-            alpha = np.arctan(h / c)
-            eps = np.arcsin(e * np.sin(phi) / g) - alpha  # from sine rule
+        #  Kludge infinite dimensions to a large value
+        a_finite = math.isfinite(a)
+        b_finite = math.isfinite(b)
+        a = a if a_finite else 1e10
+        b = b if b_finite else 1e10
 
-            #  Maximum tangency radius for centreline of beam (m)
+        #  Width of beam duct, including shielding on both sides (m)
+        c = beamwd + 2.0e0 * nbshield
 
-            current_drive_variables.rtanmax = f * np.cos(eps) - 0.5e0 * c
+        #  Major radius of inner edge of outboard TF coil (m)
+        d = r_tf_outboard_mid - 0.5e0 * b
+        d_finite = math.isfinite(d)
+        d = d if d_finite else 1e10
 
-        else:  # coil separation is too narrow for beam...
-            error_handling.fdiags[0] = g
-            error_handling.fdiags[1] = c
-            error_handling.report_error(63)
+        rtanmax, g = _portsz_kernel(n_tf_coils, a, b, c, d)
 
-            current_drive_variables.rtanmax = 0.0e0
+        return rtanbeam, rtanmax, g, c, a_finite, b_finite, d_finite
 
     def calculate_vertical_build(self, output: bool) -> None:
         """
@@ -116,598 +149,27 @@ class Build:
             None
 
         """
-        if output:
-            po.oheadr(self.outfile, "Vertical Build")
-
-            po.ovarin(
-                self.mfile,
-                "Divertor null switch",
-                "(i_single_null)",
-                physics_variables.i_single_null,
-            )
-
-            if physics_variables.i_single_null == 0:
-                po.ocmmnt(self.outfile, "Double null case")
-
-                # Start at the top and work down.
-
-                vbuild = (
-                    buildings_variables.dz_tf_cryostat
-                    + build_variables.dr_tf_inboard
-                    + build_variables.dr_tf_shld_gap
-                    + build_variables.thshield_vb
-                    + build_variables.vgap_vv_thermalshield
-                    + build_variables.d_vv_top
-                    + build_variables.shldtth
-                    + divertor_variables.divfix
-                    + build_variables.vgaptop
-                    + physics_variables.rminor * physics_variables.kappa
-                )
-
-                # To calculate vertical offset between TF coil centre and plasma centre
-                vbuile1 = vbuild
-
-                po.obuild(
-                    self.outfile,
-                    "Cryostat roof structure*",
-                    buildings_variables.dz_tf_cryostat,
-                    vbuild,
-                    "(dz_tf_cryostat)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Cryostat roof structure*",
-                    "(dz_tf_cryostat)",
-                    buildings_variables.dz_tf_cryostat,
-                )
-                vbuild = vbuild - buildings_variables.dz_tf_cryostat
-
-                # Top of TF coil
-                tf_top = vbuild
-
-                po.obuild(
-                    self.outfile,
-                    "TF coil",
-                    build_variables.dr_tf_inboard,
-                    vbuild,
-                    "(dr_tf_inboard)",
-                )
-                vbuild = vbuild - build_variables.dr_tf_inboard
-
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.dr_tf_shld_gap,
-                    vbuild,
-                    "(dr_tf_shld_gap)",
-                )
-                vbuild = vbuild - build_variables.dr_tf_shld_gap
-
-                po.obuild(
-                    self.outfile,
-                    "Thermal shield, vertical",
-                    build_variables.thshield_vb,
-                    vbuild,
-                    "(thshield_vb)",
-                )
-
-                po.ovarre(
-                    self.mfile,
-                    "Thermal shield, vertical (m)",
-                    "(thshield_vb)",
-                    build_variables.thshield_vb,
-                )
-                vbuild = vbuild - build_variables.thshield_vb
-
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.vgap_vv_thermalshield,
-                    vbuild,
-                    "(vgap_vv_thermalshield)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Vessel - TF coil vertical gap (m)",
-                    "(vgap_vv_thermalshield)",
-                    build_variables.vgap_vv_thermalshield,
-                )
-                vbuild = vbuild - build_variables.vgap_vv_thermalshield
-
-                po.obuild(
-                    self.outfile,
-                    "Vacuum vessel (and shielding)",
-                    build_variables.d_vv_top + build_variables.shldtth,
-                    vbuild,
-                    "(d_vv_top+shldtth)",
-                )
-                vbuild = vbuild - build_variables.d_vv_top - build_variables.shldtth
-                po.ovarre(
-                    self.mfile,
-                    "Topside vacuum vessel radial thickness (m)",
-                    "(d_vv_top)",
-                    build_variables.d_vv_top,
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Top radiation shield thickness (m)",
-                    "(shldtth)",
-                    build_variables.shldtth,
-                )
-
-                po.obuild(
-                    self.outfile,
-                    "Divertor structure",
-                    divertor_variables.divfix,
-                    vbuild,
-                    "(divfix)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Divertor structure vertical thickness (m)",
-                    "(divfix)",
-                    divertor_variables.divfix,
-                )
-                vbuild = vbuild - divertor_variables.divfix
-
-                po.obuild(
-                    self.outfile,
-                    "Top scrape-off",
-                    build_variables.vgaptop,
-                    vbuild,
-                    "(vgaptop)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Top scrape-off vertical thickness (m)",
-                    "(vgaptop)",
-                    build_variables.vgaptop,
-                )
-                vbuild = vbuild - build_variables.vgaptop
-
-                po.obuild(
-                    self.outfile,
-                    "Plasma top",
-                    physics_variables.rminor * physics_variables.kappa,
-                    vbuild,
-                    "(rminor*kappa)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Plasma half-height (m)",
-                    "(rminor*kappa)",
-                    physics_variables.rminor * physics_variables.kappa,
-                )
-                vbuild = vbuild - physics_variables.rminor * physics_variables.kappa
-
-                po.obuild(self.outfile, "Midplane", 0.0e0, vbuild)
-
-                vbuild = vbuild - physics_variables.rminor * physics_variables.kappa
-                po.obuild(
-                    self.outfile,
-                    "Plasma bottom",
-                    physics_variables.rminor * physics_variables.kappa,
-                    vbuild,
-                    "(rminor*kappa)",
-                )
-
-                vbuild = vbuild - build_variables.vgap_xpoint_divertor
-                po.obuild(
-                    self.outfile,
-                    "Lower scrape-off",
-                    build_variables.vgap_xpoint_divertor,
-                    vbuild,
-                    "(vgap_xpoint_divertor)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Bottom scrape-off vertical thickness (m)",
-                    "(vgap_xpoint_divertor)",
-                    build_variables.vgap_xpoint_divertor,
-                )
-
-                vbuild = vbuild - divertor_variables.divfix
-                po.obuild(
-                    self.outfile,
-                    "Divertor structure",
-                    divertor_variables.divfix,
-                    vbuild,
-                    "(divfix)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Divertor structure vertical thickness (m)",
-                    "(divfix)",
-                    divertor_variables.divfix,
-                )
-
-                vbuild = vbuild - build_variables.shldlth
-
-                vbuild = vbuild - build_variables.d_vv_bot
-                po.obuild(
-                    self.outfile,
-                    "Vacuum vessel (and shielding)",
-                    build_variables.d_vv_bot + build_variables.shldlth,
-                    vbuild,
-                    "(d_vv_bot+shldlth)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Bottom radiation shield thickness (m)",
-                    "(shldlth)",
-                    build_variables.shldlth,
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Underside vacuum vessel radial thickness (m)",
-                    "(d_vv_bot)",
-                    build_variables.d_vv_bot,
-                )
-
-                vbuild = vbuild - build_variables.vgap_vv_thermalshield
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.vgap_vv_thermalshield,
-                    vbuild,
-                    "(vgap_vv_thermalshield)",
-                )
-
-                vbuild = vbuild - build_variables.thshield_vb
-                po.obuild(
-                    self.outfile,
-                    "Thermal shield, vertical",
-                    build_variables.thshield_vb,
-                    vbuild,
-                    "(thshield_vb)",
-                )
-
-                vbuild = vbuild - build_variables.dr_tf_shld_gap
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.dr_tf_shld_gap,
-                    vbuild,
-                    "(dr_tf_shld_gap)",
-                )
-
-                vbuild = vbuild - build_variables.dr_tf_inboard
-                po.obuild(
-                    self.outfile,
-                    "TF coil",
-                    build_variables.dr_tf_inboard,
-                    vbuild,
-                    "(dr_tf_inboard)",
-                )
-
-                # Total height of TF coil
-                tf_height = tf_top - vbuild
-                # Inner vertical dimension of TF coil
-                build_variables.dh_tf_inner_bore = (
-                    tf_height - 2 * build_variables.dr_tf_inboard
-                )
-
-                vbuild = vbuild - buildings_variables.dz_tf_cryostat
-                po.obuild(
-                    self.outfile,
-                    "Cryostat floor structure**",
-                    buildings_variables.dz_tf_cryostat,
-                    vbuild,
-                    "(dz_tf_cryostat)",
-                )
-
-                # To calculate vertical offset between TF coil centre and plasma centre
-                build_variables.tfoffset = (vbuile1 + vbuild) / 2.0e0
-
-                # End of Double null case
-            else:
-                #  po.ocmmnt(self.outfile, "Single null case")
-                #  write(self.outfile, 20)
-
-                vbuild = (
-                    buildings_variables.dz_tf_cryostat
-                    + build_variables.dr_tf_inboard
-                    + build_variables.dr_tf_shld_gap
-                    + build_variables.thshield_vb
-                    + build_variables.vgap_vv_thermalshield
-                    + 0.5e0 * (build_variables.d_vv_top + build_variables.d_vv_bot)
-                    + build_variables.dr_shld_blkt_gap
-                    + build_variables.shldtth
-                    + build_variables.blnktth
-                    + 0.5e0
-                    * (build_variables.dr_fw_inboard + build_variables.dr_fw_outboard)
-                    + build_variables.vgaptop
-                    + physics_variables.rminor * physics_variables.kappa
-                )
-
-                # To calculate vertical offset between TF coil centre and plasma centre
-                vbuile1 = vbuild
+        dr_tf_inboard = build_variables.dr_tf_inboard
+        dr_tf_shld_gap = build_variables.dr_tf_shld_gap
+        thshield_vb = build_variables.thshield_vb
+        vgap_vv_thermalshield = build_variables.vgap_vv_thermalshield
+        d_vv_top = build_variables.d_vv_top
+        d_vv_bot = build_variables.d_vv_bot
+        shldtth = build_variables.shldtth
+        shldlth = build_variables.shldlth
+        divfix = divertor_variables.divfix
+        vgaptop = build_variables.vgaptop
+        vgap_xpoint_divertor = build_variables.vgap_xpoint_divertor
+        # Plasma half-height (m)
+        plasma_half_height = physics_variables.rminor * physics_variables.kappa
+        dr_shld_blkt_gap = build_variables.dr_shld_blkt_gap
+        blnktth = build_variables.blnktth
+        # Top first wall vertical thickness (m)
+        fwtth = 0.5e0 * (build_variables.dr_fw_inboard + build_variables.dr_fw_outboard)
+        i_single_null = physics_variables.i_single_null
 
-                po.obuild(
-                    self.outfile,
-                    "Cryostat roof structure*",
-                    buildings_variables.dz_tf_cryostat,
-                    vbuild,
-                    "(dz_tf_cryostat)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Cryostat roof structure*",
-                    "(dz_tf_cryostat)",
-                    buildings_variables.dz_tf_cryostat,
-                )
-                vbuild = vbuild - buildings_variables.dz_tf_cryostat
-
-                # Top of TF coil
-                tf_top = vbuild
-
-                po.obuild(
-                    self.outfile,
-                    "TF coil",
-                    build_variables.dr_tf_inboard,
-                    vbuild,
-                    "(dr_tf_inboard)",
-                )
-                vbuild = vbuild - build_variables.dr_tf_inboard
-
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.dr_tf_shld_gap,
-                    vbuild,
-                    "(dr_tf_shld_gap)",
-                )
-                vbuild = vbuild - build_variables.dr_tf_shld_gap
-
-                po.obuild(
-                    self.outfile,
-                    "Thermal shield, vertical",
-                    build_variables.thshield_vb,
-                    vbuild,
-                    "(thshield_vb)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Thermal shield, vertical (m)",
-                    "(thshield_vb)",
-                    build_variables.thshield_vb,
-                )
-                vbuild = vbuild - build_variables.thshield_vb
-
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.vgap_vv_thermalshield,
-                    vbuild,
-                    "(vgap_vv_thermalshield)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Vessel - TF coil vertical gap (m)",
-                    "(vgap_vv_thermalshield)",
-                    build_variables.vgap_vv_thermalshield,
-                )
-                vbuild = vbuild - build_variables.vgap_vv_thermalshield
-
-                po.obuild(
-                    self.outfile,
-                    "Vacuum vessel (and shielding)",
-                    build_variables.d_vv_top + build_variables.shldtth,
-                    vbuild,
-                    "(d_vv_top+shldtth)",
-                )
-                vbuild = vbuild - build_variables.d_vv_top - build_variables.shldtth
-                po.ovarre(
-                    self.mfile,
-                    "Topside vacuum vessel radial thickness (m)",
-                    "(d_vv_top)",
-                    build_variables.d_vv_top,
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Top radiation shield thickness (m)",
-                    "(shldtth)",
-                    build_variables.shldtth,
-                )
-
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.dr_shld_blkt_gap,
-                    vbuild,
-                    "(dr_shld_blkt_gap)",
-                )
-                vbuild = vbuild - build_variables.dr_shld_blkt_gap
-
-                po.obuild(
-                    self.outfile,
-                    "Top blanket",
-                    build_variables.blnktth,
-                    vbuild,
-                    "(blnktth)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Top blanket vertical thickness (m)",
-                    "(blnktth)",
-                    build_variables.blnktth,
-                )
-                vbuild = vbuild - build_variables.blnktth
-
-                fwtth = 0.5e0 * (
-                    build_variables.dr_fw_inboard + build_variables.dr_fw_outboard
-                )
-                po.obuild(self.outfile, "Top first wall", fwtth, vbuild, "(fwtth)")
-                po.ovarre(
-                    self.mfile,
-                    "Top first wall vertical thickness (m)",
-                    "(fwtth)",
-                    fwtth,
-                )
-                vbuild = vbuild - fwtth
-
-                po.obuild(
-                    self.outfile,
-                    "Top scrape-off",
-                    build_variables.vgaptop,
-                    vbuild,
-                    "(vgaptop)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Top scrape-off vertical thickness (m)",
-                    "(vgaptop)",
-                    build_variables.vgaptop,
-                )
-                vbuild = vbuild - build_variables.vgaptop
-
-                po.obuild(
-                    self.outfile,
-                    "Plasma top",
-                    physics_variables.rminor * physics_variables.kappa,
-                    vbuild,
-                    "(rminor*kappa)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Plasma half-height (m)",
-                    "(rminor*kappa)",
-                    physics_variables.rminor * physics_variables.kappa,
-                )
-                vbuild = vbuild - physics_variables.rminor * physics_variables.kappa
-
-                po.obuild(self.outfile, "Midplane", 0.0e0, vbuild)
-
-                vbuild = vbuild - physics_variables.rminor * physics_variables.kappa
-                po.obuild(
-                    self.outfile,
-                    "Plasma bottom",
-                    physics_variables.rminor * physics_variables.kappa,
-                    vbuild,
-                    "(rminor*kappa)",
-                )
-
-                vbuild = vbuild - build_variables.vgap_xpoint_divertor
-                po.obuild(
-                    self.outfile,
-                    "Lower scrape-off",
-                    build_variables.vgap_xpoint_divertor,
-                    vbuild,
-                    "(vgap_xpoint_divertor)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Bottom scrape-off vertical thickness (m)",
-                    "(vgap_xpoint_divertor)",
-                    build_variables.vgap_xpoint_divertor,
-                )
-
-                vbuild = vbuild - divertor_variables.divfix
-                po.obuild(
-                    self.outfile,
-                    "Divertor structure",
-                    divertor_variables.divfix,
-                    vbuild,
-                    "(divfix)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Divertor structure vertical thickness (m)",
-                    "(divfix)",
-                    divertor_variables.divfix,
-                )
-
-                vbuild = vbuild - build_variables.shldlth
-
-                vbuild = vbuild - build_variables.d_vv_bot
-                po.obuild(
-                    self.outfile,
-                    "Vacuum vessel (and shielding)",
-                    build_variables.d_vv_bot + build_variables.shldlth,
-                    vbuild,
-                    "(d_vv_bot+shldlth)",
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Bottom radiation shield thickness (m)",
-                    "(shldlth)",
-                    build_variables.shldlth,
-                )
-                po.ovarre(
-                    self.mfile,
-                    "Underside vacuum vessel radial thickness (m)",
-                    "(d_vv_bot)",
-                    build_variables.d_vv_bot,
-                )
-
-                vbuild = vbuild - build_variables.vgap_vv_thermalshield
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.vgap_vv_thermalshield,
-                    vbuild,
-                    "(vgap_vv_thermalshield)",
-                )
-
-                vbuild = vbuild - build_variables.thshield_vb
-                po.obuild(
-                    self.outfile,
-                    "Thermal shield, vertical",
-                    build_variables.thshield_vb,
-                    vbuild,
-                    "(thshield_vb)",
-                )
-
-                vbuild = vbuild - build_variables.dr_tf_shld_gap
-                po.obuild(
-                    self.outfile,
-                    "Gap",
-                    build_variables.dr_tf_shld_gap,
-                    vbuild,
-                    "(dr_tf_shld_gap)",
-                )
-
-                vbuild = vbuild - build_variables.dr_tf_inboard
-                po.obuild(
-                    self.outfile,
-                    "TF coil",
-                    build_variables.dr_tf_inboard,
-                    vbuild,
-                    "(dr_tf_inboard)",
-                )
-
-                # Total height of TF coil
-                tf_height = tf_top - vbuild
-                # Inner vertical dimension of TF coil
-                build_variables.dh_tf_inner_bore = (
-                    tf_height - 2 * build_variables.dr_tf_inboard
-                )
-
-                vbuild = vbuild - buildings_variables.dz_tf_cryostat
-
-                po.obuild(
-                    self.outfile,
-                    "Cryostat floor structure**",
-                    buildings_variables.dz_tf_cryostat,
-                    vbuild,
-                    "(dz_tf_cryostat)",
-                )
-
-                # To calculate vertical offset between TF coil centre and plasma centre
-                build_variables.tfoffset = (vbuile1 + vbuild) / 2.0e0
-
-                # end of Single null case
-
-            po.ovarre(
-                self.mfile,
-                "Ratio of Central Solenoid height to TF coil internal height",
-                "(ohhghf)",
-                pfcoil_variables.ohhghf,
-            )
-            po.ocmmnt(
-                self.outfile,
-                "\n*Cryostat roof allowance includes uppermost PF coil and outer thermal shield.\n*Cryostat floor allowance includes lowermost PF coil, outer thermal shield and gravity support.",
-            )
+        if output:
+            self.write_vertical_build()
 
         #  Other build quantities
 
@@ -717,47 +179,251 @@ class Build:
         # Output the cdivertor geometry
         divht = self.divgeom(output)
         # Issue #481 Remove build_variables.vgaptf
-        if build_variables.vgap_xpoint_divertor < 0.00001e0:
-            build_variables.vgap_xpoint_divertor = divht
+        if vgap_xpoint_divertor < 0.00001e0:
+            vgap_xpoint_divertor = divht
+            build_variables.vgap_xpoint_divertor = vgap_xpoint_divertor
 
-        # If build_variables.vgap_xpoint_divertor /= 0 use the value set by the user.
+        # If vgap_xpoint_divertor /= 0 use the value set by the user.
 
         # Height to inside edge of TF coil. TF coils are assumed to be symmetrical.
         # Therefore this applies to single and double null cases.
-        build_variables.hmax = (
-            physics_variables.rminor * physics_variables.kappa
-            + build_variables.vgap_xpoint_divertor
-            + divertor_variables.divfix
-            + build_variables.shldlth
-            + build_variables.d_vv_bot
-            + build_variables.vgap_vv_thermalshield
-            + build_variables.thshield_vb
-            + build_variables.dr_tf_shld_gap
-        )
+        hmax = sum((
+            plasma_half_height,
+            vgap_xpoint_divertor,
+            divfix,
+            shldlth,
+            d_vv_bot,
+            vgap_vv_thermalshield,
+            thshield_vb,
+            dr_tf_shld_gap,
+        ))
+        build_variables.hmax = hmax
 
         #  Vertical locations of divertor coils
-        if physics_variables.i_single_null == 0:
-            build_variables.hpfu = build_variables.hmax + build_variables.dr_tf_inboard
+        if i_single_null == 0:
+            build_variables.hpfu = hmax + dr_tf_inboard
             build_variables.hpfdif = 0.0e0
         else:
-            build_variables.hpfu = (
-                build_variables.dr_tf_inboard
-                + build_variables.dr_tf_shld_gap
-                + build_variables.thshield_vb
-                + build_variables.vgap_vv_thermalshield
-                + build_variables.d_vv_top
-                + build_variables.shldtth
-                + build_variables.dr_shld_blkt_gap
-                + build_variables.blnktth
-                + 0.5e0
-                * (build_variables.dr_fw_inboard + build_variables.dr_fw_outboard)
-                + build_variables.vgaptop
-                + physics_variables.rminor * physics_variables.kappa
+            hpfu = sum((
+                dr_tf_inboard,
+                dr_tf_shld_gap,
+                thshield_vb,
+                vgap_vv_thermalshield,
+                d_vv_top,
+                shldtth,
+                dr_shld_blkt_gap,
+                blnktth,
+                fwtth,
+                vgaptop,
+                plasma_half_height,
+            ))
+            build_variables.hpfu = hpfu
+            build_variables.hpfdif = (hpfu - (hmax + dr_tf_inboard)) / 2.0e0
+
+    def write_vertical_build(self) -> None:
+        """
+        Outputs the vertical build of the machine, working down from the
+        top of the cryostat roof, to the output file and mfile.
+        The TF coil internal height and the vertical offset between the TF
+        coil centre and plasma centre are set here as they follow from the
+        descent through the build.
+
+        Returns:
+            None
+        """
+        dz_tf_cryostat = buildings_variables.dz_tf_cryostat
+        dr_tf_inboard = build_variables.dr_tf_inboard
+        dr_tf_shld_gap = build_variables.dr_tf_shld_gap
+        thshield_vb = build_variables.thshield_vb
+        vgap_vv_thermalshield = build_variables.vgap_vv_thermalshield
+        d_vv_top = build_variables.d_vv_top
+        d_vv_bot = build_variables.d_vv_bot
+        shldtth = build_variables.shldtth
+        shldlth = build_variables.shldlth
+        divfix = divertor_variables.divfix
+        vgaptop = build_variables.vgaptop
+        vgap_xpoint_divertor = build_variables.vgap_xpoint_divertor
+        # Plasma half-height (m)
+        plasma_half_height = physics_variables.rminor * physics_variables.kappa
+        dr_shld_blkt_gap = build_variables.dr_shld_blkt_gap
+        blnktth = build_variables.blnktth
+        # Top first wall vertical thickness (m)
+        fwtth = 0.5e0 * (build_variables.dr_fw_inboard + build_variables.dr_fw_outboard)
+        i_single_null = physics_variables.i_single_null
+
+        po.oheadr(self.outfile, "Vertical Build")
+
+        po.ovarin(
+            self.mfile,
+            "Divertor null switch",
+            "(i_single_null)",
+            i_single_null,
+        )
+
+        if i_single_null == 0:
+            po.ocmmnt(self.outfile, "Double null case")
+
+            # Start at the top and work down.
+
+            vbuild = (
+                dz_tf_cryostat
+                + dr_tf_inboard
+                + dr_tf_shld_gap
+                + thshield_vb
+                + vgap_vv_thermalshield
+                + d_vv_top
+                + shldtth
+                + divfix
+                + vgaptop
+                + plasma_half_height
             )
-            build_variables.hpfdif = (
-                build_variables.hpfu
-                - (build_variables.hmax + build_variables.dr_tf_inboard)
-            ) / 2.0e0
+
+            # Upper divertor of the double null configuration
+            top_layers = [["Divertor structure", "divfix", divfix]]
+            top_mfile_data = [
+                ["Divertor structure vertical thickness (m)", "divfix", divfix],
+            ]
+        else:
+            #  po.ocmmnt(self.outfile, "Single null case")
+            #  write(self.outfile, 20)
+
+            vbuild = (
+                dz_tf_cryostat
+                + dr_tf_inboard
+                + dr_tf_shld_gap
+                + thshield_vb
+                + vgap_vv_thermalshield
+                + 0.5e0 * (d_vv_top + d_vv_bot)
+                + dr_shld_blkt_gap
+                + shldtth
+                + blnktth
+                + fwtth
+                + vgaptop
+                + plasma_half_height
+            )
+
+            # Top blanket and first wall of the single null configuration
+            top_layers = [
+                ["Gap", "dr_shld_blkt_gap", dr_shld_blkt_gap],
+                ["Top blanket", "blnktth", blnktth],
+                ["Top first wall", "fwtth", fwtth],
+            ]
+            top_mfile_data = [
+                ["Top blanket vertical thickness (m)", "blnktth", blnktth],
+                ["Top first wall vertical thickness (m)", "fwtth", fwtth],
+            ]
+
+        # Layers above the midplane, from the top of the cryostat roof down:
+        # description, variable name, thickness
+        upper_layers = [
+            ["Cryostat roof structure*", "dz_tf_cryostat", dz_tf_cryostat],
+            ["TF coil", "dr_tf_inboard", dr_tf_inboard],
+            ["Gap", "dr_tf_shld_gap", dr_tf_shld_gap],
+            ["Thermal shield, vertical", "thshield_vb", thshield_vb],
+            ["Gap", "vgap_vv_thermalshield", vgap_vv_thermalshield],
+            [
+                "Vacuum vessel (and shielding)",
+                "d_vv_top+shldtth",
+                d_vv_top + shldtth,
+            ],
+            *top_layers,
+            ["Top scrape-off", "vgaptop", vgaptop],
+            ["Plasma top", "rminor*kappa", plasma_half_height],
+        ]
+        # Layers below the midplane, down to the bottom of the cryostat floor
+        lower_layers = [
+            ["Plasma bottom", "rminor*kappa", plasma_half_height],
+            ["Lower scrape-off", "vgap_xpoint_divertor", vgap_xpoint_divertor],
+            ["Divertor structure", "divfix", divfix],
+            [
+                "Vacuum vessel (and shielding)",
+                "d_vv_bot+shldlth",
+                d_vv_bot + shldlth,
+            ],
+            ["Gap", "vgap_vv_thermalshield", vgap_vv_thermalshield],
+            ["Thermal shield, vertical", "thshield_vb", thshield_vb],
+            ["Gap", "dr_tf_shld_gap", dr_tf_shld_gap],
+            ["TF coil", "dr_tf_inboard", dr_tf_inboard],
+            ["Cryostat floor structure**", "dz_tf_cryostat", dz_tf_cryostat],
+        ]
+
+        # Vertical position of the top of each layer, and of the bottom of
+        # the last one
+        levels = vbuild - np.concatenate((
+            [0.0e0],
+            np.cumsum([thickness for _, _, thickness in upper_layers + lower_layers]),
+        ))
+
+        # Layers above the midplane are reported at their top surface, and
+        # those below at their bottom surface
+        n_upper = len(upper_layers)
+        vertical_build_data = [
+            [description, variable, thickness, levels[i]]
+            for i, (description, variable, thickness) in enumerate(upper_layers)
+        ]
+        vertical_build_data.append(["Midplane", None, 0.0e0, levels[n_upper]])
+        vertical_build_data.extend(
+            [description, variable, thickness, levels[n_upper + i + 1]]
+            for i, (description, variable, thickness) in enumerate(lower_layers)
+        )
+
+        # Top of TF coil
+        tf_top = levels[1]
+
+        # Total height of TF coil
+        tf_height = tf_top - levels[-2]
+        # Inner vertical dimension of TF coil
+        build_variables.dh_tf_inner_bore = tf_height - 2 * dr_tf_inboard
+
+        # To calculate vertical offset between TF coil centre and plasma centre
+        build_variables.tfoffset = (levels[0] + levels[-1]) / 2.0e0
+
+        # MFILE entries: description, variable name, value
+        vertical_build_mfile_data = [
+            ["Cryostat roof structure*", "dz_tf_cryostat", dz_tf_cryostat],
+            ["Thermal shield, vertical (m)", "thshield_vb", thshield_vb],
+            [
+                "Vessel - TF coil vertical gap (m)",
+                "vgap_vv_thermalshield",
+                vgap_vv_thermalshield,
+            ],
+            ["Topside vacuum vessel radial thickness (m)", "d_vv_top", d_vv_top],
+            ["Top radiation shield thickness (m)", "shldtth", shldtth],
+            *top_mfile_data,
+            ["Top scrape-off vertical thickness (m)", "vgaptop", vgaptop],
+            ["Plasma half-height (m)", "rminor*kappa", plasma_half_height],
+            [
+                "Bottom scrape-off vertical thickness (m)",
+                "vgap_xpoint_divertor",
+                vgap_xpoint_divertor,
+            ],
+            ["Divertor structure vertical thickness (m)", "divfix", divfix],
+            ["Bottom radiation shield thickness (m)", "shldlth", shldlth],
+            ["Underside vacuum vessel radial thickness (m)", "d_vv_bot", d_vv_bot],
+        ]
+
+        for description, variable, thickness, vbuild in vertical_build_data:
+            po.obuild(
+                self.outfile,
+                description,
+                thickness,
+                vbuild,
+                f"({variable})" if variable else "",
+            )
+
+        for description, variable, value in vertical_build_mfile_data:
+            po.ovarre(self.mfile, description, f"({variable})", value)
+
+        po.ovarre(
+            self.mfile,
+            "Ratio of Central Solenoid height to TF coil internal height",
+            "(ohhghf)",
+            pfcoil_variables.ohhghf,
+        )
+        po.ocmmnt(
+            self.outfile,
+            "\n*Cryostat roof allowance includes uppermost PF coil and outer thermal shield.\n*Cryostat floor allowance includes lowermost PF coil, outer thermal shield and gravity support.",
+        )
 
     def cryostat_output(self, output: bool) -> None:
         """
@@ -812,6 +478,21 @@ class Build:
                 "OP ",
             )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _divertor_geometry(
+        rmajor, rminor, kap, tril, plsepi, plsepo, plleni, plleno, betai, betao
+    ):
+        """Conventional tokamak divertor geometry, memoised on its (float) inputs
+
+        Returns the divertor height and outer strike point radius, followed
+        by the plasma arc radii, leg angles, X-point, strike point and plate
+        end positions used in the report (see divgeom).
+        """
+        return _divertor_geometry_kernel(
+            rmajor, rminor, kap, tril, plsepi, plsepo, plleni, plleno, betai, betao
+        )
+
     def divgeom(self, output: bool):
         """
                 Divertor geometry calculation
@@ -835,650 +516,248 @@ class Build:
         triu = physics_variables.triang
         tril = physics_variables.triang
 
-        # Old method: assumes that divertor arms are continuations of arcs
-        #
-        # Outboard side
-        # build_variables.plsepo = poloidal length along the separatrix from null to
-        # strike point on outboard [default 1.5 m]
-        # thetao = arc angle between the strike point and the null point
-        #
-        # xpointo = physics_variables.rmajor + 0.5e0*physics_variables.rminor*(kap**2 + tri**2 - 1.0e0) /     #     (1.0e0 - tri)
-        # rprimeo = (xpointo - physics_variables.rmajor + physics_variables.rminor)
-        # phio = asin(kap*physics_variables.rminor/rprimeo)
-        # thetao = build_variables.plsepo/rprimeo
-        #
-        # Initial strike point
-        #
-        # yspointo = rprimeo * sin(thetao + phio)
-        # xspointo = xpointo - rprimeo * cos(thetao + phio)
-        #
-        # Outboard strike point radius - normalized to ITER
-        #
-        # rstrko = xspointo + 0.14e0
-        #
-        # Uppermost divertor strike point (end of power decay)
-        # anginc = angle of incidence of scrape-off field lines on the
-        # divertor (rad)
-        #
-        # +**PJK 25/07/11 Changed sign of anginc contribution
-        # yprimeb = soleno * cos(thetao + phio - anginc)
-        #
-        # divht = yprimeb + yspointo - kap*physics_variables.rminor
-
-        # New method, assuming straight legs -- superceded by new method 26/5/2016
-        # Assumed 90 degrees at X-pt -- wrong#
-        #
-        #  Find half-angle of outboard arc
-        # denomo = (tril**2 + kap**2 - 1.0e0)/( 2.0e0*(1.0e0+tril) ) - tril
-        # thetao = atan(kap/denomo)
-        # Angle between horizontal and inner divertor leg
-        # alphad = (pi/2.0e0) - thetao
-
-        # Method 26/05/2016
-        # Find radius of inner and outer plasma arcs
-
-        rco = 0.5 * np.sqrt(
-            (physics_variables.rminor**2 * ((tril + 1.0e0) ** 2 + kap**2) ** 2)
-            / ((tril + 1.0e0) ** 2)
-        )
-        rci = 0.5 * np.sqrt(
-            (physics_variables.rminor**2 * ((tril - 1.0e0) ** 2 + kap**2) ** 2)
-            / ((tril - 1.0e0) ** 2)
-        )
-
-        # Find angles between vertical and legs
-        # Inboard arc angle = outboard leg angle
-
-        thetao = np.arcsin(1.0e0 - (physics_variables.rminor * (1.0e0 - tril)) / rci)
-
-        # Outboard arc angle = inboard leg angle
-
-        thetai = np.arcsin(1.0e0 - (physics_variables.rminor * (1.0e0 + tril)) / rco)
-
-        #  Position of lower x-pt
-        rxpt = physics_variables.rmajor - tril * physics_variables.rminor
-        zxpt = -1.0e0 * kap * physics_variables.rminor
-
-        # Position of inner strike point
-        # rspi = rxpt - build_variables.plsepi*cos(alphad)
-        # zspi = zxpt - build_variables.plsepi*sin(alphad)
-        rspi = rxpt - build_variables.plsepi * np.cos(thetai)
-        zspi = zxpt - build_variables.plsepi * np.sin(thetai)
-
-        # Position of outer strike point
-        # build_variables.rspo = rxpt + build_variables.plsepo*cos((pi/2.0e0)-alphad)
-        # zspo = zxpt - build_variables.plsepo*sin((pi/2.0e0)-alphad)
-        build_variables.rspo = rxpt + build_variables.plsepo * np.cos(thetao)
-        zspo = zxpt - build_variables.plsepo * np.sin(thetao)
-
-        # Position of inner plate ends
-        # rplti = rspi - (build_variables.plleni/2.0e0)*sin(divertor_variables.betai + alphad - pi/2.0e0)
-        # zplti = zspi + (build_variables.plleni/2.0e0)*cos(divertor_variables.betai + alphad - pi/2.0e0)
-        # rplbi = rspi + (build_variables.plleni/2.0e0)*sin(divertor_variables.betai + alphad - pi/2.0e0)
-        # zplbi = zspi - (build_variables.plleni/2.0e0)*cos(divertor_variables.betai + alphad - pi/2.0e0)
-        rplti = rspi + (build_variables.plleni / 2.0e0) * np.cos(
-            thetai + divertor_variables.betai
-        )
-        zplti = zspi + (build_variables.plleni / 2.0e0) * np.sin(
-            thetai + divertor_variables.betai
-        )
-        rplbi = rspi - (build_variables.plleni / 2.0e0) * np.cos(
-            thetai + divertor_variables.betai
-        )
-        zplbi = zspi - (build_variables.plleni / 2.0e0) * np.sin(
-            thetai + divertor_variables.betai
-        )
-
-        # Position of outer plate ends
-        # rplto = build_variables.rspo + (build_variables.plleno/2.0e0)*sin(divertor_variables.betao - alphad)
-        # zplto = zspo + (build_variables.plleno/2.0e0)*cos(divertor_variables.betao - alphad)
-        # rplbo = build_variables.rspo - (build_variables.plleno/2.0e0)*sin(divertor_variables.betao - alphad)
-        # zplbo = zspo - (build_variables.plleno/2.0e0)*cos(divertor_variables.betao - alphad)
-        rplto = build_variables.rspo - (build_variables.plleno / 2.0e0) * np.cos(
-            thetao + divertor_variables.betao
-        )
-        zplto = zspo + (build_variables.plleno / 2.0e0) * np.sin(
-            thetao + divertor_variables.betao
-        )
-        rplbo = build_variables.rspo + (build_variables.plleno / 2.0e0) * np.cos(
-            thetao + divertor_variables.betao
-        )
-        zplbo = zspo - (build_variables.plleno / 2.0e0) * np.sin(
-            thetao + divertor_variables.betao
+        geometry = self._divertor_geometry(
+            float(physics_variables.rmajor),
+            float(physics_variables.rminor),
+            float(kap),
+            float(tril),
+            float(build_variables.plsepi),
+            float(build_variables.plsepo),
+            float(build_variables.plleni),
+            float(build_variables.plleno),
+            float(divertor_variables.betai),
+            float(divertor_variables.betao),
         )
 
-        divht = max(zplti, zplto) - min(zplbo, zplbi)
+        divht, build_variables.rspo, *_ = geometry
 
         if output:
-            if physics_variables.idivrt == 1:
-                po.oheadr(self.outfile, "Divertor build and plasma position")
-                po.ocmmnt(self.outfile, "Divertor Configuration = Single Null Divertor")
-                po.oblnkl(self.outfile)
-                ptop_radial = physics_variables.rmajor - triu * physics_variables.rminor
-                ptop_vertical = kap * physics_variables.rminor
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma top position, radial (m)",
-                    "(ptop_radial)",
-                    ptop_radial,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma top position, vertical (m)",
-                    "(ptop_vertical)",
-                    ptop_vertical,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma geometric centre, radial (m)",
-                    "(physics_variables.rmajor.)",
-                    physics_variables.rmajor,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma geometric centre, vertical (m)",
-                    "(0.0)",
-                    0.0e0,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma lower physics_variables.triangularity",
-                    "(tril)",
-                    tril,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma elongation",
-                    "(physics_variables.kappa.)",
-                    kap,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "TF coil vertical offset (m)",
-                    "(tfoffset)",
-                    build_variables.tfoffset,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma outer arc radius of curvature (m)",
-                    "(rco)",
-                    rco,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma inner arc radius of curvature (m)",
-                    "(rci)",
-                    rci,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile, "Plasma lower X-pt, radial (m)", "(rxpt)", rxpt, "OP "
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma lower X-pt, vertical (m)",
-                    "(zxpt)",
-                    zxpt,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between vertical and inner leg (rad)",
-                    "(thetai)",
-                    thetai,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between vertical and outer leg (rad)",
-                    "(thetao)",
-                    thetao,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between inner leg and plate (rad)",
-                    "(betai)",
-                    divertor_variables.betai,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between outer leg and plate (rad)",
-                    "(betao)",
-                    divertor_variables.betao,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner divertor leg poloidal length (m)",
-                    "(plsepi)",
-                    build_variables.plsepi,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer divertor leg poloidal length (m)",
-                    "(plsepo)",
-                    build_variables.plsepo,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner divertor plate length (m)",
-                    "(plleni)",
-                    build_variables.plleni,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer divertor plate length (m)",
-                    "(plleno)",
-                    build_variables.plleno,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner strike point, radial (m)",
-                    "(rspi)",
-                    rspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner strike point, vertical (m)",
-                    "(zspi)",
-                    zspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile, "Inner plate top, radial (m)", "(rplti)", rplti, "OP "
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner plate top, vertical (m)",
-                    "(zplti)",
-                    zplti,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner plate bottom, radial (m)",
-                    "(rplbi)",
-                    rplbi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner plate bottom, vertical (m)",
-                    "(zplbi)",
-                    zplbi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer strike point, radial (m)",
-                    "(rspo)",
-                    build_variables.rspo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer strike point, vertical (m)",
-                    "(zspo)",
-                    zspo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile, "Outer plate top, radial (m)", "(rplto)", rplto, "OP "
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer plate top, vertical (m)",
-                    "(zplto)",
-                    zplto,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer plate bottom, radial (m)",
-                    "(rplbo)",
-                    rplbo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer plate bottom, vertical (m)",
-                    "(zplbo)",
-                    zplbo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Calculated maximum divertor height (m)",
-                    "(divht)",
-                    divht,
-                    "OP ",
-                )
+            self.write_divertor_geometry(geometry, kap, triu, tril)
+        return divht
 
-            elif physics_variables.idivrt == 2:
-                po.oheadr(self.outfile, "Divertor build and plasma position")
-                po.ocmmnt(self.outfile, "Divertor Configuration = Double Null Divertor")
-                po.oblnkl(self.outfile)
-                # Assume upper and lower divertors geometries are symmetric.
-                ptop_radial = physics_variables.rmajor - triu * physics_variables.rminor
-                ptop_vertical = kap * physics_variables.rminor
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma top position, radial (m)",
-                    "(ptop_radial)",
-                    ptop_radial,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma top position, vertical (m)",
-                    "(ptop_vertical)",
-                    ptop_vertical,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma geometric centre, radial (m)",
-                    "(rmajor.)",
-                    physics_variables.rmajor,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma geometric centre, vertical (m)",
-                    "(0.0)",
-                    0.0e0,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma physics_variables.triangularity",
-                    "(tril)",
-                    tril,
-                    "OP ",
-                )
-                po.ovarrf(self.outfile, "Plasma elongation", "(kappa.)", kap, "OP ")
-                po.ovarrf(
-                    self.outfile,
-                    "TF coil vertical offset (m)",
-                    "(tfoffset)",
-                    build_variables.tfoffset,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile, "Plasma upper X-pt, radial (m)", "(rxpt)", rxpt, "OP "
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma upper X-pt, vertical (m)",
-                    "(-zxpt)",
-                    -zxpt,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma outer arc radius of curvature (m)",
-                    "(rco)",
-                    rco,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma inner arc radius of curvature (m)",
-                    "(rci)",
-                    rci,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile, "Plasma lower X-pt, radial (m)", "(rxpt)", rxpt, "OP "
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Plasma lower X-pt, vertical (m)",
-                    "(zxpt)",
-                    zxpt,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between vertical and inner leg (rad)",
-                    "(thetai)",
-                    thetai,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between vertical and outer leg (rad)",
-                    "(thetao)",
-                    thetao,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between inner leg and plate (rad)",
-                    "(betai)",
-                    divertor_variables.betai,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Poloidal plane angle between outer leg and plate (rad)",
-                    "(betao)",
-                    divertor_variables.betao,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner divertor leg poloidal length (m)",
-                    "(plsepi)",
-                    build_variables.plsepi,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer divertor leg poloidal length (m)",
-                    "(plsepo)",
-                    build_variables.plsepo,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Inner divertor plate length (m)",
-                    "(lleni)",
-                    build_variables.plleni,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Outer divertor plate length (m)",
-                    "(plleno)",
-                    build_variables.plleno,
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner strike point, radial (m)",
-                    "(rspi)",
-                    rspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner strike point, vertical (m)",
-                    "(-zspi)",
-                    -zspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner plate top, radial (m)",
-                    "(rplti)",
-                    rplti,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner plate top, vertical (m)",
-                    "(-zplti)",
-                    -zplti,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner plate bottom, radial (m)",
-                    "(rplbi)",
-                    rplbi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper inner plate bottom, vertical (m)",
-                    "(-zplbi)",
-                    -zplbi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer strike point, radial (m)",
-                    "(rspo)",
-                    build_variables.rspo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer strike point, vertical (m)",
-                    "(-zspo)",
-                    -zspo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer plate top, radial (m)",
-                    "(rplto)",
-                    rplto,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer plate top, vertical (m)",
-                    "(-zplto)",
-                    -zplto,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer plate bottom, radial (m)",
-                    "(rplbo)",
-                    rplbo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Upper outer plate bottom, vertical (m)",
-                    "(-zplbo)",
-                    -zplbo,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner strike point, radial (m)",
-                    "(rspi)",
-                    rspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner strike point, vertical (m)",
-                    "(zspi)",
-                    zspi,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner plate top, radial (m)",
-                    "(rplti)",
-                    rplti,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner plate top, vertical (m)",
-                    "(zplti)",
-                    zplti,
-                    "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner plate bottom, radial (m)",
-                    "(rplbi)",
-                    rplbi,
+    def write_divertor_geometry(self, geometry, kap, triu, tril) -> None:
+        """Write the conventional divertor geometry to the output files
+
+        geometry : tuple returned by _divertor_geometry
+        kap : plasma elongation
+        triu, tril : upper and lower plasma triangularity
+        """
+        if physics_variables.idivrt not in (1, 2):
+            po.oheadr(self.outfile, "Divertor build and plasma position")
+            po.ocmmnt(
+                self.outfile,
+                "ERROR: null value not supported, check i_single_null value.",
+            )
+            return
+
+        (
+            divht,
+            rspo,
+            rco,
+            rci,
+            thetao,
+            thetai,
+            rxpt,
+            zxpt,
+            rspi,
+            zspi,
+            zspo,
+            rplti,
+            zplti,
+            rplbi,
+            zplbi,
+            rplto,
+            zplto,
+            rplbo,
+            zplbo,
+        ) = geometry
+
+        double_null = physics_variables.idivrt == 2
+        ptop_radial = physics_variables.rmajor - triu * physics_variables.rminor
+        ptop_vertical = kap * physics_variables.rminor
+
+        # Strike points and plate ends of the lower divertor as
+        # (description, radial name, radial, vertical name, vertical)
+        divertor_points = [
+            ("inner strike point", "rspi", rspi, "zspi", zspi),
+            ("inner plate top", "rplti", rplti, "zplti", zplti),
+            ("inner plate bottom", "rplbi", rplbi, "zplbi", zplbi),
+            ("outer strike point", "rspo", rspo, "zspo", zspo),
+            ("outer plate top", "rplto", rplto, "zplto", zplto),
+            ("outer plate bottom", "rplbo", rplbo, "zplbo", zplbo),
+        ]
+
+        # Rows of ovarrf arguments after the output unit; rows without an
+        # output flag are written without one
+        if double_null:
+            # Assume upper and lower divertors geometries are symmetric.
+            divertor_data = [
+                (
+                    "Plasma top position, radial (m)",
+                    "(ptop_radial)",
+                    ptop_radial,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower inner plate bottom, vertical (m)",
-                    "(zplbi)",
-                    zplbi,
+                ),
+                (
+                    "Plasma top position, vertical (m)",
+                    "(ptop_vertical)",
+                    ptop_vertical,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer strike point, radial (m)",
-                    "(rspo)",
-                    build_variables.rspo,
+                ),
+                (
+                    "Plasma geometric centre, radial (m)",
+                    "(rmajor.)",
+                    physics_variables.rmajor,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer strike point, vertical (m)",
-                    "(zspo)",
-                    zspo,
+                ),
+                ("Plasma geometric centre, vertical (m)", "(0.0)", 0.0e0, "OP "),
+                ("Plasma physics_variables.triangularity", "(tril)", tril, "OP "),
+                ("Plasma elongation", "(kappa.)", kap, "OP "),
+                (
+                    "TF coil vertical offset (m)",
+                    "(tfoffset)",
+                    build_variables.tfoffset,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer plate top, radial (m)",
-                    "(rplto)",
-                    rplto,
+                ),
+                ("Plasma upper X-pt, radial (m)", "(rxpt)", rxpt, "OP "),
+                ("Plasma upper X-pt, vertical (m)", "(-zxpt)", -zxpt, "OP "),
+            ]
+        else:
+            divertor_data = [
+                (
+                    "Plasma top position, radial (m)",
+                    "(ptop_radial)",
+                    ptop_radial,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer plate top, vertical (m)",
-                    "(zplto)",
-                    zplto,
+                ),
+                (
+                    "Plasma top position, vertical (m)",
+                    "(ptop_vertical)",
+                    ptop_vertical,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer plate bottom, radial (m)",
-                    "(rplbo)",
-                    rplbo,
+                ),
+                (
+                    "Plasma geometric centre, radial (m)",
+                    "(physics_variables.rmajor.)",
+                    physics_variables.rmajor,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Lower outer plate bottom, vertical (m)",
-                    "(zplbo)",
-                    zplbo,
+                ),
+                ("Plasma geometric centre, vertical (m)", "(0.0)", 0.0e0, "OP "),
+                (
+                    "Plasma lower physics_variables.triangularity",
+                    "(tril)",
+                    tril,
                     "OP ",
-                )
-                po.ovarrf(
-                    self.outfile,
-                    "Calculated maximum divertor height (m)",
-                    "(divht)",
-                    divht,
+                ),
+                ("Plasma elongation", "(physics_variables.kappa.)", kap, "OP "),
+                (
+                    "TF coil vertical offset (m)",
+                    "(tfoffset)",
+                    build_variables.tfoffset,
                     "OP ",
-                )
-            else:
-                po.oheadr(self.outfile, "Divertor build and plasma position")
-                po.ocmmnt(
-                    self.outfile,
-                    "ERROR: null value not supported, check i_single_null value.",
-                )
-        return divht
+                ),
+            ]
+
+        divertor_data += [
+            ("Plasma outer arc radius of curvature (m)", "(rco)", rco, "OP "),
+            ("Plasma inner arc radius of curvature (m)", "(rci)", rci, "OP "),
+            ("Plasma lower X-pt, radial (m)", "(rxpt)", rxpt, "OP "),
+            ("Plasma lower X-pt, vertical (m)", "(zxpt)", zxpt, "OP "),
+            (
+                "Poloidal plane angle between vertical and inner leg (rad)",
+                "(thetai)",
+                thetai,
+                "OP ",
+            ),
+            (
+                "Poloidal plane angle between vertical and outer leg (rad)",
+                "(thetao)",
+                thetao,
+                "OP ",
+            ),
+            (
+                "Poloidal plane angle between inner leg and plate (rad)",
+                "(betai)",
+                divertor_variables.betai,
+            ),
+            (
+                "Poloidal plane angle between outer leg and plate (rad)",
+                "(betao)",
+                divertor_variables.betao,
+            ),
+            (
+                "Inner divertor leg poloidal length (m)",
+                "(plsepi)",
+                build_variables.plsepi,
+            ),
+            (
+                "Outer divertor leg poloidal length (m)",
+                "(plsepo)",
+                build_variables.plsepo,
+            ),
+            (
+                "Inner divertor plate length (m)",
+                "(lleni)" if double_null else "(plleni)",
+                build_variables.plleni,
+            ),
+            ("Outer divertor plate length (m)", "(plleno)", build_variables.plleno),
+        ]
+
+        if double_null:
+            # The upper divertor mirrors the lower one in the midplane
+            for description, rname, radial, zname, vertical in divertor_points:
+                divertor_data += [
+                    (
+                        f"Upper {description}, radial (m)",
+                        f"({rname})",
+                        radial,
+                        "OP ",
+                    ),
+                    (
+                        f"Upper {description}, vertical (m)",
+                        f"(-{zname})",
+                        -vertical,
+                        "OP ",
+                    ),
+                ]
+            lower_prefix = "Lower "
+        else:
+            lower_prefix = ""
+
+        for description, rname, radial, zname, vertical in divertor_points:
+            description = f"{lower_prefix}{description}"
+            description = description[0].upper() + description[1:]
+            divertor_data += [
+                (f"{description}, radial (m)", f"({rname})", radial, "OP "),
+                (f"{description}, vertical (m)", f"({zname})", vertical, "OP "),
+            ]
+
+        divertor_data.append((
+            "Calculated maximum divertor height (m)",
+            "(divht)",
+            divht,
+            "OP ",
+        ))
+
+        po.oheadr(self.outfile, "Divertor build and plasma position")
+        if double_null:
+            po.ocmmnt(self.outfile, "Divertor Configuration = Double Null Divertor")
+        else:
+            po.ocmmnt(self.outfile, "Divertor Configuration = Single Null Divertor")
+        po.oblnkl(self.outfile)
+        for row in divertor_data:
+            po.ovarrf(self.outfile, *row)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _fitted_ripple(n, x, r_plasma_out, r_tf_outboard_mid, ripmax):
+        """Fitted TF ripple, memoised on its (float) inputs
+
+        Returns the ripple at the plasma edge (%), the TF leg radius giving
+        a ripple of ripmax (m) (see ripple_amplitude), and whether the fit base
+        and that radius had to be kludged.
+        """
+        return _fitted_ripple_kernel(n, x, r_plasma_out, r_tf_outboard_mid, ripmax)
 
     def ripple_amplitude(self, ripmax: float, r_tf_outboard_mid: float) -> float:
         """
@@ -1509,9 +788,31 @@ class Build:
 
         """
         n = float(tfcoil_variables.n_tf_coils)
+        rmajor = physics_variables.rmajor
+
+        # Outboard plasma edge radius [m]
+        r_plasma_out = rmajor + physics_variables.rminor
+        # Ratio of plasma edge to TF coil leg centre radii
+        r_ratio = r_plasma_out / r_tf_outboard_mid
+
+        if tfcoil_variables.i_tf_shape == 2:
+            # Ken McClements ST picture frame coil analytical ripple calc
+            # Calculated ripple for coil at r_tf_outboard_mid (%)
+            ripple = 100.0e0 * math.pow(r_ratio, n)
+            #  Calculated r_tf_outboard_mid to produce a ripple of amplitude ripmax
+            r_tf_outboard_midmin = r_plasma_out / math.pow(0.01e0 * ripmax, 1.0e0 / n)
+            return ripple, r_tf_outboard_midmin, 0
+
+        r_tf_inboard_in = build_variables.r_tf_inboard_in
+        thkcas = tfcoil_variables.thkcas
+        dr_tf_wp = tfcoil_variables.dr_tf_wp
+        tinstf = tfcoil_variables.tinstf
+        tfinsgap = tfcoil_variables.tfinsgap
+        tan_half_angle = math.tan(math.pi / n)
+
         if tfcoil_variables.i_tf_sup == 1:
             # Minimal inboard WP radius [m]
-            r_wp_min = build_variables.r_tf_inboard_in + tfcoil_variables.thkcas
+            r_wp_min = r_tf_inboard_in + thkcas
 
             # Rectangular WP
             if tfcoil_variables.i_tf_wp_geom == 0:
@@ -1519,115 +820,71 @@ class Build:
 
             # Double rectangle WP
             elif tfcoil_variables.i_tf_wp_geom == 1:
-                r_wp_max = r_wp_min + 0.5e0 * tfcoil_variables.dr_tf_wp
+                r_wp_max = r_wp_min + 0.5e0 * dr_tf_wp
 
             # Trapezoidal WP
             elif tfcoil_variables.i_tf_wp_geom == 2:
-                r_wp_max = r_wp_min + tfcoil_variables.dr_tf_wp
+                r_wp_max = r_wp_min + dr_tf_wp
 
             # Calculated maximum toroidal WP toroidal thickness [m]
             if tfcoil_variables.tfc_sidewall_is_fraction:
                 t_wp_max = 2.0e0 * (
                     (r_wp_max - tfcoil_variables.casths_fraction * r_wp_min)
-                    * np.tan(np.pi / n)
-                    - tfcoil_variables.tinstf
-                    - tfcoil_variables.tfinsgap
+                    * tan_half_angle
+                    - tinstf
+                    - tfinsgap
                 )
             else:
                 t_wp_max = 2.0e0 * (
-                    r_wp_max * np.tan(np.pi / n)
+                    r_wp_max * tan_half_angle
                     - tfcoil_variables.casths
-                    - tfcoil_variables.tinstf
-                    - tfcoil_variables.tfinsgap
+                    - tinstf
+                    - tfinsgap
                 )
 
         # Resistive magnet case
         else:
             # Radius used to define the t_wp_max [m]
-            r_wp_max = (
-                build_variables.r_tf_inboard_in
-                + tfcoil_variables.thkcas
-                + tfcoil_variables.dr_tf_wp
-            )
+            r_wp_max = r_tf_inboard_in + thkcas + dr_tf_wp
 
             # Calculated maximum toroidal WP toroidal thickness [m]
-            t_wp_max = 2.0e0 * r_wp_max * np.tan(np.pi / n)
-
-        flag = 0
-        if tfcoil_variables.i_tf_shape == 2:
-            # Ken McClements ST picture frame coil analytical ripple calc
-            # Calculated ripple for coil at r_tf_outboard_mid (%)
-            ripple = 100.0e0 * (
-                (physics_variables.rmajor + physics_variables.rminor)
-                / r_tf_outboard_mid
-            ) ** (n)
-            #  Calculated r_tf_outboard_mid to produce a ripple of amplitude ripmax
-            r_tf_outboard_midmin = (
-                physics_variables.rmajor + physics_variables.rminor
-            ) / ((0.01e0 * ripmax) ** (1.0e0 / n))
-        else:
-            # Winding pack to iter-coil at plasma centre toroidal lenth ratio
-            x = t_wp_max * n / physics_variables.rmajor
-
-            # Fitting parameters
-            c1 = 0.875e0 - 0.0557e0 * x
-            c2 = 1.617e0 + 0.0832e0 * x
+            t_wp_max = 2.0e0 * r_wp_max * tan_half_angle
+
+        # Winding pack to iter-coil at plasma centre toroidal lenth ratio
+        x = t_wp_max * n / rmajor
+
+        ripple, r_tf_outboard_midmin, base_kludged, radius_kludged = (
+            self._fitted_ripple(
+                n,
+                float(x),
+                float(r_plasma_out),
+                float(r_tf_outboard_mid),
+                float(ripmax),
+            )
+        )
 
-            #  Calculated ripple for coil at r_tf_outboard_mid (%)
-            ripple = (
-                100.0e0
-                * c1
-                * (
-                    (physics_variables.rmajor + physics_variables.rminor)
-                    / r_tf_outboard_mid
-                )
-                ** (n - c2)
+        # Logged outside the cached fit so that every kludged evaluation is
+        # reported
+        if base_kludged:
+            logger.error("base is <= 1e-6. Kludging to 1e-6.")
+        if radius_kludged:
+            logger.error(
+                "r_tf_outboard_midmin is not finite. Kludging to a large value instead."
             )
 
-            #  Calculated r_tf_outboard_mid to produce a ripple of amplitude ripmax
-            base = 0.01 * ripmax / c1
-            # Avoid potential negative or complex result: kludge base to be
-            # small and positive if required
-            try:
-                assert base > 1e-6
-            except AssertionError:
-                logger.exception("base is <= 1e-6. Kludging to 1e-6.")
-                base = 1e-6
-
-            r_tf_outboard_midmin = (
-                physics_variables.rmajor + physics_variables.rminor
-            ) / (base ** (1.0 / (n - c2)))
-
-            try:
-                assert r_tf_outboard_midmin < np.inf
-            except AssertionError:
-                logger.exception(
-                    "r_tf_outboard_midmin is inf. Kludging to a large value instead."
-                )
-                r_tf_outboard_midmin = (
-                    physics_variables.rmajor + physics_variables.rminor
-                ) * 3
-
-            #  Notify via flag if a range of applicability is violated
-            flag = 0
-            if (x < 0.737e0) or (x > 2.95e0):
-                flag = 1
-            if (tfcoil_variables.n_tf_coils < 16) or (tfcoil_variables.n_tf_coils > 20):
-                flag = 2
-            if (
-                (physics_variables.rmajor + physics_variables.rminor)
-                / r_tf_outboard_mid
-                < 0.7e0
-            ) or (
-                (physics_variables.rmajor + physics_variables.rminor)
-                / r_tf_outboard_mid
-                > 0.8e0
-            ):
-                flag = 3
+        #  Notify via flag if a range of applicability is violated
+        flag = 0
+        if (x < 0.737e0) or (x > 2.95e0):
+            flag = 1
+        if (n < 16) or (n > 20):
+            flag = 2
+        if (r_ratio < 0.7e0) or (r_ratio > 0.8e0):
+            flag = 3
 
         return ripple, r_tf_outboard_midmin, flag
 
-    def tf_in_cs_bore_calc(self):
+    @staticmethod
+    def tf_in_cs_bore_calc():
         build_variables.dr_bore += (
             build_variables.dr_tf_inboard + build_variables.dr_cs_tf_gap
         )
@@ -1682,7 +939,7 @@ class Build:
         if build_variables.i_cs_precomp == 1:
             build_variables.dr_cs_precomp = build_variables.fseppc / (
                 2.0e0
-                * np.pi
+                * math.pi
                 * build_variables.fcspc
                 * build_variables.sigallpc
                 * (
@@ -1711,7 +968,8 @@ class Build:
 
         # Issue #514 Radial dimensions of inboard leg
         # Calculate build_variables.dr_tf_inboard if tfcoil_variables.dr_tf_wp is an iteration variable (140)
-        if any(numerics.ixc[0 : numerics.nvar] == 140):
+        dr_tf_wp_is_itv = (numerics.ixc[: numerics.nvar] == 140).any()
+        if dr_tf_wp_is_itv:
             # SC TF coil thickness defined using its maximum (diagonal)
             if tfcoil_variables.i_tf_sup == 1:
                 build_variables.dr_tf_inboard = (
@@ -1719,8 +977,8 @@ class Build:
                     + tfcoil_variables.dr_tf_wp
                     + tfcoil_variables.casthi
                     + tfcoil_variables.thkcas
-                ) / np.cos(
-                    np.pi / tfcoil_variables.n_tf_coils
+                ) / math.cos(
+                    math.pi / tfcoil_variables.n_tf_coils
                 ) - build_variables.r_tf_inboard_in
 
             # Rounded resistive TF geometry
@@ -1743,11 +1001,11 @@ class Build:
 
         # WP radial thickness [m]
         # Calculated only if not used as an iteration variable
-        if not any(numerics.ixc[0 : numerics.nvar] == 140):
+        if not dr_tf_wp_is_itv:
             # SC magnets
             if tfcoil_variables.i_tf_sup == 1:
                 tfcoil_variables.dr_tf_wp = (
-                    np.cos(np.pi / tfcoil_variables.n_tf_coils)
+                    math.cos(math.pi / tfcoil_variables.n_tf_coils)
                     * build_variables.r_tf_inboard_out
                     - build_variables.r_tf_inboard_in
                     - tfcoil_variables.casthi
@@ -1762,24 +1020,28 @@ class Build:
                     - tfcoil_variables.thkcas
                 )
 
+        # Radius of the plasma top and the inboard build between it and the
+        # TF coil, shared by the shape-derived centrepost radius and its bound
+        r_plasma_top = (
+            physics_variables.rmajor
+            - physics_variables.rminor * physics_variables.triang
+        )
+        dr_inboard_sum = (
+            build_variables.dr_tf_shld_gap
+            + build_variables.dr_shld_thermal_inboard
+            + build_variables.dr_shld_inboard
+            + build_variables.dr_shld_blkt_gap
+            + build_variables.dr_blkt_inboard
+            + build_variables.dr_fw_inboard
+            + 3.0e0 * build_variables.dr_fw_plasma_gap_inboard
+        )
+        r_cp_top_max = r_plasma_top - dr_inboard_sum + tfcoil_variables.drtop
+
         # Radius of the centrepost at the top of the machine
         if physics_variables.itart == 1 and tfcoil_variables.i_tf_sup != 1:
             # build_variables.r_cp_top is set using the plasma shape
             if build_variables.i_r_cp_top == 0:
-                build_variables.r_cp_top = (
-                    physics_variables.rmajor
-                    - physics_variables.rminor * physics_variables.triang
-                    - (
-                        build_variables.dr_tf_shld_gap
-                        + build_variables.dr_shld_thermal_inboard
-                        + build_variables.dr_shld_inboard
-                        + build_variables.dr_shld_blkt_gap
-                        + build_variables.dr_blkt_inboard
-                        + build_variables.dr_fw_inboard
-                        + 3.0e0 * build_variables.dr_fw_plasma_gap_inboard
-                    )
-                    + tfcoil_variables.drtop
-                )
+                build_variables.r_cp_top = r_cp_top_max
 
                 # Notify user that build_variables.r_cp_top has been set to 1.01*build_variables.r_tf_inboard_out (lvl 2 error)
                 if build_variables.r_cp_top < 1.01e0 * build_variables.r_tf_inboard_out:
@@ -1821,19 +1083,7 @@ class Build:
             build_variables.r_cp_top = build_variables.r_tf_inboard_out
 
         if build_variables.i_r_cp_top != 0 and (
-            build_variables.r_cp_top
-            > physics_variables.rmajor
-            - physics_variables.rminor * physics_variables.triang
-            - (
-                build_variables.dr_tf_shld_gap
-                + build_variables.dr_shld_thermal_inboard
-                + build_variables.dr_shld_inboard
-                + build_variables.dr_shld_blkt_gap
-                + build_variables.dr_blkt_inboard
-                + build_variables.dr_fw_inboard
-                + 3.0e0 * build_variables.dr_fw_plasma_gap_inboard
-            )
-            + tfcoil_variables.drtop
+            build_variables.r_cp_top > r_cp_top_max
         ):
             error_handling.fdiags[0] = build_variables.r_cp_top
             error_handling.report_error(256)
@@ -1946,20 +1196,21 @@ class Build:
             ) - (
                 build_variables.r_tf_inboard_mid - 0.5e0 * build_variables.dr_tf_inboard
             )
+
+            #  Call tfcoil_variables.ripple calculation again with new build_variables.r_tf_outboard_mid/build_variables.dr_shld_vv_gap_outboard value
+            #  call rippl(tfcoil_variables.ripmax,rmajor,rminor,r_tf_outboard_mid,n_tf_coils,ripple,r_tf_outboard_midl)
+            (
+                tfcoil_variables.ripple,
+                r_tf_outboard_midl,
+                self.ripflag,
+            ) = self.ripple_amplitude(
+                tfcoil_variables.ripmax,
+                build_variables.r_tf_outboard_mid,
+            )
         else:
+            # The leg position is unchanged, so the first ripple result stands
             build_variables.dr_shld_vv_gap_outboard = build_variables.gapomin
 
-        #  Call tfcoil_variables.ripple calculation again with new build_variables.r_tf_outboard_mid/build_variables.dr_shld_vv_gap_outboard value
-        #  call rippl(tfcoil_variables.ripmax,rmajor,rminor,r_tf_outboard_mid,n_tf_coils,ripple,r_tf_outboard_midl)
-        (
-            tfcoil_variables.ripple,
-            r_tf_outboard_midl,
-            self.ripflag,
-        ) = self.ripple_amplitude(
-            tfcoil_variables.ripmax,
-            build_variables.r_tf_outboard_mid,
-        )
-
         #  Calculate first wall area
         #  Old calculation... includes a mysterious factor 0.875
         # fwarea = 0.875e0 *     #     ( 4.0e0*pi**2*sf*physics_variables.rmajor*(physics_variables.rminor+0.5e0*(build_variables.dr_fw_plasma_gap_inboard+build_variables.dr_fw_plasma_gap_outboard)) )
@@ -2002,20 +1253,13 @@ class Build:
             ) - r1
             #  Calculate surface area, assuming 100% coverage
 
-            (
-                build_variables.fwareaib,
-                build_variables.fwareaob,
-                build_variables.fwarea,
-            ) = dshellarea(r1, r2, hfw)
+            fwareaib, fwareaob, _ = dshellarea(r1, r2, hfw)
 
         else:  # Cross-section is assumed to be defined by two ellipses
             #  Major radius to centre of inboard and outboard ellipses
             #  (coincident in radius with top of plasma)
 
-            r1 = (
-                physics_variables.rmajor
-                - physics_variables.rminor * physics_variables.triang
-            )
+            r1 = r_plasma_top
 
             #  Distance between r1 and outer edge of inboard section
 
@@ -2035,31 +1279,14 @@ class Build:
 
             #  Calculate surface area, assuming 100% coverage
 
-            (
-                build_variables.fwareaib,
-                build_variables.fwareaob,
-                build_variables.fwarea,
-            ) = eshellarea(r1, r2, r3, hfw)
-
-        #  Apply area coverage factor
+            fwareaib, fwareaob, _ = eshellarea(r1, r2, r3, hfw)
 
-        if physics_variables.idivrt == 2:
-            # Double null configuration
-            build_variables.fwareaob = build_variables.fwareaob * (
-                1.0e0 - 2.0e0 * fwbs_variables.fdiv - fwbs_variables.fhcd
-            )
-            build_variables.fwareaib = build_variables.fwareaib * (
-                1.0e0 - 2.0e0 * fwbs_variables.fdiv - fwbs_variables.fhcd
-            )
-        else:
-            # Single null configuration
-            build_variables.fwareaob = build_variables.fwareaob * (
-                1.0e0 - fwbs_variables.fdiv - fwbs_variables.fhcd
-            )
-            build_variables.fwareaib = build_variables.fwareaib * (
-                1.0e0 - fwbs_variables.fdiv - fwbs_variables.fhcd
-            )
+        #  Apply area coverage factor (divertor ports at both ends for double null)
 
+        n_divertors = 2.0e0 if physics_variables.idivrt == 2 else 1.0e0
+        coverage = 1.0e0 - n_divertors * fwbs_variables.fdiv - fwbs_variables.fhcd
+        build_variables.fwareaib = fwareaib * coverage
+        build_variables.fwareaob = fwareaob * coverage
         build_variables.fwarea = build_variables.fwareaib + build_variables.fwareaob
 
         if build_variables.fwareaob <= 0.0e0:
@@ -2067,378 +1294,557 @@ class Build:
             error_handling.fdiags[1] = fwbs_variables.fhcd
             error_handling.report_error(61)
 
-        #
-
         if output:
-            #  Print out device build
+            self.write_radial_build()
 
-            po.oheadr(self.outfile, "Radial Build")
+    def write_radial_build(self) -> None:
+        """
+        Outputs the radial build of the machine, working out from the
+        device centreline, to the output file and mfile.
 
-            if self.ripflag != 0:
-                po.ocmmnt(
-                    self.outfile,
-                    "(Ripple result may not be accurate, as the fit was outside",
-                )
-                po.ocmmnt(self.outfile, " its range of applicability.)")
-                po.oblnkl(self.outfile)
-                error_handling.report_error(62)
-
-                if self.ripflag == 1:
-                    error_handling.fdiags[0] = (
-                        tfcoil_variables.wwp1
-                        * tfcoil_variables.n_tf_coils
-                        / physics_variables.rmajor
-                    )
-                    error_handling.report_error(141)
-                elif self.ripflag == 2:
-                    # Convert to integer as idiags is integer array
-                    error_handling.idiags[0] = int(tfcoil_variables.n_tf_coils)
-                    error_handling.report_error(142)
-                else:
-                    error_handling.fdiags[0] = (
-                        physics_variables.rmajor + physics_variables.rminor
-                    ) / build_variables.r_tf_outboard_mid
-                    error_handling.report_error(143)
-
-            po.ovarin(
+        Returns:
+            None
+        """
+        #  Print out device build
+
+        po.oheadr(self.outfile, "Radial Build")
+
+        if self.ripflag != 0:
+            po.ocmmnt(
                 self.outfile,
-                "TF coil radial placement switch",
-                "(tf_in_cs)",
-                build_variables.tf_in_cs,
+                "(Ripple result may not be accurate, as the fit was outside",
             )
-            po.ovarrf(
+            po.ocmmnt(self.outfile, " its range of applicability.)")
+            po.oblnkl(self.outfile)
+            error_handling.report_error(62)
+
+            if self.ripflag == 1:
+                error_handling.fdiags[0] = (
+                    tfcoil_variables.wwp1
+                    * tfcoil_variables.n_tf_coils
+                    / physics_variables.rmajor
+                )
+                error_handling.report_error(141)
+            elif self.ripflag == 2:
+                # Convert to integer as idiags is integer array
+                error_handling.idiags[0] = int(tfcoil_variables.n_tf_coils)
+                error_handling.report_error(142)
+            else:
+                error_handling.fdiags[0] = (
+                    physics_variables.rmajor + physics_variables.rminor
+                ) / build_variables.r_tf_outboard_mid
+                error_handling.report_error(143)
+
+        po.ovarin(
+            self.outfile,
+            "TF coil radial placement switch",
+            "(tf_in_cs)",
+            build_variables.tf_in_cs,
+        )
+        po.ovarrf(
+            self.outfile,
+            "Inboard build thickness (m)",
+            "(dr_inboard_build)",
+            physics_variables.rmajor - physics_variables.rminor,
+            "OP ",
+        )
+
+        if build_variables.tf_in_cs == 1:
+            po.ocmmnt(
                 self.outfile,
-                "Inboard build thickness (m)",
-                "(dr_inboard_build)",
-                physics_variables.rmajor - physics_variables.rminor,
-                "OP ",
+                ("\n (The stated machine dr_bore size is just for the hollow space, "),
+            )
+            po.ocmmnt(
+                self.outfile,
+                (
+                    "the true dr_bore size used for calculations is dr_bore + dr_tf_inboard + dr_cs_tf_gap)\n"
+                ),
+            )
+        if build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking >= 2:
+            po.ocmmnt(
+                self.outfile,
+                "(Bore hollow space has been filled with a solid metal cyclinder to act as wedge support)\n",
             )
 
-            if build_variables.tf_in_cs == 1:
-                po.ocmmnt(
-                    self.outfile,
-                    (
-                        "\n (The stated machine dr_bore size is just for the hollow space, "
-                    ),
-                )
-                po.ocmmnt(
-                    self.outfile,
-                    (
-                        "the true dr_bore size used for calculations is dr_bore + dr_tf_inboard + dr_cs_tf_gap)\n"
-                    ),
-                )
-            if build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking >= 2:
-                po.ocmmnt(
-                    self.outfile,
-                    "(Bore hollow space has been filled with a solid metal cyclinder to act as wedge support)\n",
-                )
-
-            # an array that holds the following information
-            # description, variable name, thickness, radius
-            radial_build_data = []
-
-            radius = 0.0e0
-            radial_build_data.append(["Device centreline", None, 0.0, radius])
-            if build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking >= 2:
-                radius = (
-                    radius
-                    + build_variables.dr_bore
-                    - build_variables.dr_tf_inboard
-                    - build_variables.dr_cs_tf_gap
-                )
-
-                radial_build_data.append([
-                    "Machine dr_bore wedge support cylinder",
-                    "dr_bore",
-                    build_variables.dr_bore
-                    - build_variables.dr_tf_inboard
-                    - build_variables.dr_cs_tf_gap,
-                    radius,
-                ])
-            elif build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking < 2:
-                radius = (
-                    radius
-                    + build_variables.dr_bore
-                    - build_variables.dr_tf_inboard
-                    - build_variables.dr_cs_tf_gap
-                )
-                radial_build_data.append([
-                    "Machine dr_bore hole",
-                    "dr_bore",
-                    build_variables.dr_bore
-                    - build_variables.dr_tf_inboard
-                    - build_variables.dr_cs_tf_gap,
-                    radius,
-                ])
-            else:
-                radius = radius + build_variables.dr_bore
-                radial_build_data.append([
-                    "Machine dr_bore",
-                    "dr_bore",
-                    build_variables.dr_bore,
-                    radius,
-                ])
-            if build_variables.tf_in_cs == 1:
-                radius += build_variables.dr_tf_inboard
-                radial_build_data.append([
-                    "TF coil inboard leg (in dr_bore)",
-                    "dr_tf_inboard",
-                    build_variables.dr_tf_inboard,
-                    radius,
-                ])
-
-                radius += build_variables.dr_cs_tf_gap
-                radial_build_data.append([
-                    "CS precompresion to TF coil radial gap",
-                    "dr_cs_tf_gap",
-                    build_variables.dr_cs_tf_gap,
-                    radius,
-                ])
-
-            radius = radius + build_variables.dr_cs
-            radial_build_data.append([
-                "Central solenoid",
-                "dr_cs",
-                build_variables.dr_cs,
-                radius,
-            ])
+        # an array that holds the following information
+        # description, variable name, thickness
+        radial_build_data = []
 
-            radius = radius + build_variables.dr_cs_precomp
+        radial_build_data.append(["Device centreline", None, 0.0])
+        if build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking >= 2:
             radial_build_data.append([
-                "CS precompression",
-                "dr_cs_precomp",
-                build_variables.dr_cs_precomp,
-                radius,
-            ])
-            if build_variables.tf_in_cs == 0:
-                radius = radius + build_variables.dr_cs_tf_gap
-                radial_build_data.append([
-                    "CS precompresion to TF coil radial gap",
-                    "dr_cs_tf_gap",
-                    build_variables.dr_cs_tf_gap,
-                    radius,
-                ])
-
-                radius = radius + build_variables.dr_tf_inboard
-                radial_build_data.append([
-                    "TF coil inboard leg",
-                    "dr_tf_inboard",
-                    build_variables.dr_tf_inboard,
-                    radius,
-                ])
-
-            radius = radius + build_variables.dr_tf_shld_gap
-            radial_build_data.append([
-                "TF coil inboard leg insulation gap",
-                "dr_tf_shld_gap",
-                build_variables.dr_tf_shld_gap,
-                radius,
+                "Machine dr_bore wedge support cylinder",
+                "dr_bore",
+                build_variables.dr_bore
+                - build_variables.dr_tf_inboard
+                - build_variables.dr_cs_tf_gap,
             ])
-
-            radius = radius + build_variables.dr_shld_thermal_inboard
+        elif build_variables.tf_in_cs == 1 and tfcoil_variables.i_tf_bucking < 2:
             radial_build_data.append([
-                "Thermal shield, inboard",
-                "dr_shld_thermal_inboard",
-                build_variables.dr_shld_thermal_inboard,
-                radius,
+                "Machine dr_bore hole",
+                "dr_bore",
+                build_variables.dr_bore
+                - build_variables.dr_tf_inboard
+                - build_variables.dr_cs_tf_gap,
             ])
-
-            radius = radius + build_variables.dr_shld_vv_gap_inboard
+        else:
             radial_build_data.append([
-                "Thermal shield to vessel radial gap",
-                "dr_shld_vv_gap_inboard",
-                build_variables.dr_shld_vv_gap_inboard,
-                radius,
+                "Machine dr_bore",
+                "dr_bore",
+                build_variables.dr_bore,
             ])
-
-            radius += build_variables.dr_vv_inboard
+        if build_variables.tf_in_cs == 1:
             radial_build_data.append([
-                "Inboard vacuum vessel",
-                "dr_vv_inboard",
-                build_variables.dr_vv_inboard,
-                radius,
+                "TF coil inboard leg (in dr_bore)",
+                "dr_tf_inboard",
+                build_variables.dr_tf_inboard,
             ])
 
-            radius += build_variables.dr_shld_inboard
             radial_build_data.append([
-                "Inner radiation shield",
-                "dr_shld_inboard",
-                build_variables.dr_shld_inboard,
-                radius,
+                "CS precompresion to TF coil radial gap",
+                "dr_cs_tf_gap",
+                build_variables.dr_cs_tf_gap,
             ])
 
-            radius = radius + build_variables.dr_shld_blkt_gap
+        radial_build_data.append([
+            "Central solenoid",
+            "dr_cs",
+            build_variables.dr_cs,
+        ])
+
+        radial_build_data.append([
+            "CS precompression",
+            "dr_cs_precomp",
+            build_variables.dr_cs_precomp,
+        ])
+        if build_variables.tf_in_cs == 0:
             radial_build_data.append([
-                "Gap",
-                "dr_shld_blkt_gap",
-                build_variables.dr_shld_blkt_gap,
-                radius,
+                "CS precompresion to TF coil radial gap",
+                "dr_cs_tf_gap",
+                build_variables.dr_cs_tf_gap,
             ])
 
-            radius = radius + build_variables.dr_blkt_inboard
             radial_build_data.append([
-                "Inboard blanket",
-                "dr_blkt_inboard",
-                build_variables.dr_blkt_inboard,
-                radius,
+                "TF coil inboard leg",
+                "dr_tf_inboard",
+                build_variables.dr_tf_inboard,
             ])
 
-            radius = radius + build_variables.dr_fw_inboard
-            radial_build_data.append([
-                "Inboard first wall",
-                "dr_fw_inboard",
-                build_variables.dr_fw_inboard,
+        radial_build_data.append([
+            "TF coil inboard leg insulation gap",
+            "dr_tf_shld_gap",
+            build_variables.dr_tf_shld_gap,
+        ])
+
+        radial_build_data.append([
+            "Thermal shield, inboard",
+            "dr_shld_thermal_inboard",
+            build_variables.dr_shld_thermal_inboard,
+        ])
+
+        radial_build_data.append([
+            "Thermal shield to vessel radial gap",
+            "dr_shld_vv_gap_inboard",
+            build_variables.dr_shld_vv_gap_inboard,
+        ])
+
+        radial_build_data.append([
+            "Inboard vacuum vessel",
+            "dr_vv_inboard",
+            build_variables.dr_vv_inboard,
+        ])
+
+        radial_build_data.append([
+            "Inner radiation shield",
+            "dr_shld_inboard",
+            build_variables.dr_shld_inboard,
+        ])
+
+        radial_build_data.append([
+            "Gap",
+            "dr_shld_blkt_gap",
+            build_variables.dr_shld_blkt_gap,
+        ])
+
+        radial_build_data.append([
+            "Inboard blanket",
+            "dr_blkt_inboard",
+            build_variables.dr_blkt_inboard,
+        ])
+
+        radial_build_data.append([
+            "Inboard first wall",
+            "dr_fw_inboard",
+            build_variables.dr_fw_inboard,
+        ])
+
+        radial_build_data.append([
+            "Inboard scrape-off",
+            "dr_fw_plasma_gap_inboard",
+            build_variables.dr_fw_plasma_gap_inboard,
+        ])
+
+        radial_build_data.append([
+            "Plasma geometric centre",
+            "rminor",
+            physics_variables.rminor,
+        ])
+
+        radial_build_data.append([
+            "Plasma outboard edge",
+            "rminor",
+            physics_variables.rminor,
+        ])
+
+        radial_build_data.append([
+            "Outboard scrape-off",
+            "dr_fw_plasma_gap_outboard",
+            build_variables.dr_fw_plasma_gap_outboard,
+        ])
+
+        radial_build_data.append([
+            "Outboard first wall",
+            "dr_fw_outboard",
+            build_variables.dr_fw_outboard,
+        ])
+
+        radial_build_data.append([
+            "Outboard blanket",
+            "dr_blkt_outboard",
+            build_variables.dr_blkt_outboard,
+        ])
+
+        radial_build_data.append([
+            "Gap",
+            "dr_shld_blkt_gap",
+            build_variables.dr_shld_blkt_gap,
+        ])
+
+        radial_build_data.append([
+            "Outer radiation shield",
+            "dr_shld_outboard",
+            build_variables.dr_shld_outboard,
+        ])
+
+        radial_build_data.append([
+            "Outboard vacuum vessel",
+            "dr_vv_outboard",
+            build_variables.dr_vv_outboard,
+        ])
+
+        radial_build_data.append([
+            "Vessel to TF gap",
+            "dr_shld_vv_gap_outboard",
+            build_variables.dr_shld_vv_gap_outboard,
+        ])
+
+        radial_build_data.append([
+            "Ouboard thermal shield",
+            "dr_shld_thermal_outboard",
+            build_variables.dr_shld_thermal_outboard,
+        ])
+
+        radial_build_data.append([
+            "Gap",
+            "dr_tf_shld_gap",
+            build_variables.dr_tf_shld_gap,
+        ])
+
+        radial_build_data.append([
+            "TF coil outboard leg",
+            "dr_tf_outboard",
+            build_variables.dr_tf_outboard,
+        ])
+
+        # Radius at the outer edge of each component
+        radii = np.cumsum([thickness for _, _, thickness in radial_build_data])
+        radial_build_data = [
+            [
+                description,
+                variable,
+                thickness,
                 radius,
-            ])
+                f"({variable})" if variable else "",
+            ]
+            for (description, variable, thickness), radius in zip(
+                radial_build_data, radii, strict=True
+            )
+        ]
 
-            radius = radius + build_variables.dr_fw_plasma_gap_inboard
-            radial_build_data.append([
-                "Inboard scrape-off",
-                "dr_fw_plasma_gap_inboard",
-                build_variables.dr_fw_plasma_gap_inboard,
-                radius,
-            ])
+        for description, _, thickness, radius, label in radial_build_data:
+            po.obuild(self.outfile, description, thickness, radius, label)
 
-            radius = radius + physics_variables.rminor
-            radial_build_data.append([
-                "Plasma geometric centre",
-                "rminor",
-                physics_variables.rminor,
-                radius,
-            ])
+        # use manual index to ensure count is contiguous in the event
+        # of a `None` variable component
+        index = 0
+        for description, variable, thickness, radius, label in radial_build_data:
+            if variable is None:
+                continue
 
-            radius = radius + physics_variables.rminor
-            radial_build_data.append([
-                "Plasma outboard edge",
-                "rminor",
-                physics_variables.rminor,
-                radius,
-            ])
+            index += 1
 
-            radius = radius + build_variables.dr_fw_plasma_gap_outboard
-            radial_build_data.append([
-                "Outboard scrape-off",
-                "dr_fw_plasma_gap_outboard",
-                build_variables.dr_fw_plasma_gap_outboard,
-                radius,
-            ])
+            po.ovarre(
+                self.mfile,
+                f"{description} radial thickness (m)",
+                label,
+                thickness,
+            )
 
-            radius = radius + build_variables.dr_fw_outboard
-            radial_build_data.append([
-                "Outboard first wall",
-                "dr_fw_outboard",
-                build_variables.dr_fw_outboard,
+            po.ovarst(
+                self.mfile,
+                f"Radial build component {index}",
+                f"(radial_label({index}))",
+                f'"{variable}"',
+            )
+            po.ovarre(
+                self.mfile,
+                f"Radial build cumulative radius {index}",
+                f"(radial_cum({index}))",
                 radius,
-            ])
+            )
 
-            radius = radius + build_variables.dr_blkt_outboard
-            radial_build_data.append([
-                "Outboard blanket",
-                "dr_blkt_outboard",
-                build_variables.dr_blkt_outboard,
-                radius,
-            ])
+        if (current_drive_variables.iefrf in [5, 8]) or (
+            current_drive_variables.iefrffix in [5, 8]
+        ):
+            po.ovarre(
+                self.mfile,
+                "Width of neutral beam duct where it passes between the TF coils (m)",
+                "(beamwd)",
+                current_drive_variables.beamwd,
+            )
 
-            radius = radius + build_variables.dr_shld_blkt_gap
-            radial_build_data.append([
-                "Gap",
-                "dr_shld_blkt_gap",
-                build_variables.dr_shld_blkt_gap,
-                radius,
-            ])
 
-            radius += build_variables.dr_shld_outboard
-            radial_build_data.append([
-                "Outer radiation shield",
-                "dr_shld_outboard",
-                build_variables.dr_shld_outboard,
-                radius,
-            ])
+# Compiled eagerly at import (and cached on disk) so the first call of portsz
+# in a run does not stall on JIT compilation
+@numba.njit(
+    "UniTuple(float64, 2)(float64, float64, float64, float64, float64)", cache=True
+)
+def _portsz_kernel(n_tf_coils, a, b, c, d):
+    """Geometric core of the port size calculation (see Build.portsz)
 
-            radius += build_variables.dr_vv_outboard
-            radial_build_data.append([
-                "Outboard vacuum vessel",
-                "dr_vv_outboard",
-                build_variables.dr_vv_outboard,
-                radius,
-            ])
+    n_tf_coils : number of TF coils
+    a : half-width of outboard TF coil in toroidal direction (m)
+    b : radial thickness of outboard TF coil leg (m)
+    c : width of beam duct, including shielding on both sides (m)
+    d : major radius of inner edge of outboard TF coil (m)
 
-            radius = radius + build_variables.dr_shld_vv_gap_outboard
-            radial_build_data.append([
-                "Vessel to TF gap",
-                "dr_shld_vv_gap_outboard",
-                build_variables.dr_shld_vv_gap_outboard,
-                radius,
-            ])
+    Returns the maximum tangency radius for the centreline of the beam (m),
+    which is zero if the coil separation is too narrow for the beam, and the
+    separation between adjacent coils g (m).
+    """
+    #  Toroidal angle between adjacent TF coils
+    omega = math.tau / n_tf_coils
 
-            radius = radius + build_variables.dr_shld_thermal_outboard
-            radial_build_data.append([
-                "Ouboard thermal shield",
-                "dr_shld_thermal_outboard",
-                build_variables.dr_shld_thermal_outboard,
-                radius,
-            ])
+    #  Refer to figure in User Guide for remaining geometric calculations
+    e = math.sqrt(a * a + (d + b) * (d + b))
+    f = math.sqrt(a * a + d * d)
 
-            radius = radius + build_variables.dr_tf_shld_gap
-            radial_build_data.append([
-                "Gap",
-                "dr_tf_shld_gap",
-                build_variables.dr_tf_shld_gap,
-                radius,
-            ])
+    theta = omega - math.atan(a / d)
+    phi = theta - math.asin(a / e)
 
-            radius = radius + build_variables.dr_tf_outboard
-            radial_build_data.append([
-                "TF coil outboard leg",
-                "dr_tf_outboard",
-                build_variables.dr_tf_outboard,
-                radius,
-            ])
+    g = math.sqrt(e * e + f * f - 2.0e0 * e * f * math.cos(phi))  # cosine rule
 
-            for description, variable, thickness, radius in radial_build_data:
-                po.obuild(
-                    self.outfile,
-                    description,
-                    thickness,
-                    radius,
-                    f"({variable})" if variable else "",
-                )
+    if g <= c:
+        return 0.0e0, g
 
-            # use manual index to ensure count is contiguous in the event
-            # of a `None` variable component
-            index = 0
-            for description, variable, thickness, radius in radial_build_data:
-                if variable is None:
-                    continue
+    h = math.sqrt(g * g - c * c)
 
-                index += 1
+    alpha = math.atan(h / c)
+    eps = math.asin(e * math.sin(phi) / g) - alpha  # from sine rule
 
-                po.ovarre(
-                    self.mfile,
-                    f"{description} radial thickness (m)",
-                    f"({variable})",
-                    thickness,
-                )
+    return f * math.cos(eps) - 0.5e0 * c, g
 
-                po.ovarst(
-                    self.mfile,
-                    f"Radial build component {index}",
-                    f"(radial_label({index}))",
-                    f'"{variable}"',
-                )
-                po.ovarre(
-                    self.mfile,
-                    f"Radial build cumulative radius {index}",
-                    f"(radial_cum({index}))",
-                    radius,
-                )
 
-            if (current_drive_variables.iefrf in [5, 8]) or (
-                current_drive_variables.iefrffix in [5, 8]
-            ):
-                po.ovarre(
-                    self.mfile,
-                    "Width of neutral beam duct where it passes between the TF coils (m)",
-                    "(beamwd)",
-                    current_drive_variables.beamwd,
-                )
+# Compiled eagerly at import, like _portsz_kernel
+@numba.njit(
+    "UniTuple(float64, 19)(float64, float64, float64, float64, float64,"
+    " float64, float64, float64, float64, float64)",
+    cache=True,
+)
+def _divertor_geometry_kernel(
+    rmajor, rminor, kap, tril, plsepi, plsepo, plleni, plleno, betai, betao
+):
+    """Conventional tokamak divertor geometry (see Build.divgeom)
+
+    Returns the divertor height and outer strike point radius, followed by
+    the plasma arc radii, leg angles, X-point, strike point and plate end
+    positions used in the report.
+    """
+
+    # Old method: assumes that divertor arms are continuations of arcs
+    #
+    # Outboard side
+    # build_variables.plsepo = poloidal length along the separatrix from null to
+    # strike point on outboard [default 1.5 m]
+    # thetao = arc angle between the strike point and the null point
+    #
+    # xpointo = physics_variables.rmajor + 0.5e0*physics_variables.rminor*(kap**2 + tri**2 - 1.0e0) /     #     (1.0e0 - tri)
+    # rprimeo = (xpointo - physics_variables.rmajor + physics_variables.rminor)
+    # phio = asin(kap*physics_variables.rminor/rprimeo)
+    # thetao = build_variables.plsepo/rprimeo
+    #
+    # Initial strike point
+    #
+    # yspointo = rprimeo * sin(thetao + phio)
+    # xspointo = xpointo - rprimeo * cos(thetao + phio)
+    #
+    # Outboard strike point radius - normalized to ITER
+    #
+    # rstrko = xspointo + 0.14e0
+    #
+    # Uppermost divertor strike point (end of power decay)
+    # anginc = angle of incidence of scrape-off field lines on the
+    # divertor (rad)
+    #
+    # +**PJK 25/07/11 Changed sign of anginc contribution
+    # yprimeb = soleno * cos(thetao + phio - anginc)
+    #
+    # divht = yprimeb + yspointo - kap*physics_variables.rminor
+
+    # New method, assuming straight legs -- superceded by new method 26/5/2016
+    # Assumed 90 degrees at X-pt -- wrong#
+    #
+    #  Find half-angle of outboard arc
+    # denomo = (tril**2 + kap**2 - 1.0e0)/( 2.0e0*(1.0e0+tril) ) - tril
+    # thetao = atan(kap/denomo)
+    # Angle between horizontal and inner divertor leg
+    # alphad = (pi/2.0e0) - thetao
+
+    # Method 26/05/2016
+    # Find radius of inner and outer plasma arcs
+
+    # 0.5*sqrt(a**2 * ((t+1)**2 + k**2)**2 / (t+1)**2) reduces exactly to
+    # 0.5*a*((t+1)**2 + k**2)/|t+1|, and likewise for t-1
+    tp = tril + 1.0e0
+    tm = tril - 1.0e0
+    k2 = kap * kap
+    half_rminor = 0.5e0 * rminor
+    rco = half_rminor * (tp * tp + k2) / abs(tp)
+    rci = half_rminor * (tm * tm + k2) / abs(tm)
+
+    # Find angles between vertical and legs
+    # Inboard arc angle = outboard leg angle
+
+    sin_thetao = 1.0e0 + (rminor * tm) / rci
+    thetao = math.asin(sin_thetao)
+    cos_thetao = math.sqrt(1.0e0 - sin_thetao * sin_thetao)
+
+    # Outboard arc angle = inboard leg angle
+
+    sin_thetai = 1.0e0 - (rminor * tp) / rco
+    thetai = math.asin(sin_thetai)
+    cos_thetai = math.sqrt(1.0e0 - sin_thetai * sin_thetai)
+
+    #  Position of lower x-pt
+    rxpt = rmajor - tril * rminor
+    zxpt = -1.0e0 * kap * rminor
+
+    # Position of inner strike point
+    # rspi = rxpt - build_variables.plsepi*cos(alphad)
+    # zspi = zxpt - build_variables.plsepi*sin(alphad)
+    rspi = rxpt - plsepi * cos_thetai
+    zspi = zxpt - plsepi * sin_thetai
+
+    # Position of outer strike point
+    # build_variables.rspo = rxpt + build_variables.plsepo*cos((pi/2.0e0)-alphad)
+    # zspo = zxpt - build_variables.plsepo*sin((pi/2.0e0)-alphad)
+    rspo = rxpt + plsepo * cos_thetao
+    zspo = zxpt - plsepo * sin_thetao
+
+    # Position of inner plate ends
+    # rplti = rspi - (build_variables.plleni/2.0e0)*sin(divertor_variables.betai + alphad - pi/2.0e0)
+    # zplti = zspi + (build_variables.plleni/2.0e0)*cos(divertor_variables.betai + alphad - pi/2.0e0)
+    # rplbi = rspi + (build_variables.plleni/2.0e0)*sin(divertor_variables.betai + alphad - pi/2.0e0)
+    # zplbi = zspi - (build_variables.plleni/2.0e0)*cos(divertor_variables.betai + alphad - pi/2.0e0)
+    half_plleni = plleni / 2.0e0
+    # Angle addition for the plate angle thetai + betai
+    cos_betai = math.cos(betai)
+    sin_betai = math.sin(betai)
+    cos_plate_i = cos_thetai * cos_betai - sin_thetai * sin_betai
+    sin_plate_i = sin_thetai * cos_betai + cos_thetai * sin_betai
+    rplti = rspi + half_plleni * cos_plate_i
+    zplti = zspi + half_plleni * sin_plate_i
+    rplbi = rspi - half_plleni * cos_plate_i
+    zplbi = zspi - half_plleni * sin_plate_i
+
+    # Position of outer plate ends
+    # rplto = build_variables.rspo + (build_variables.plleno/2.0e0)*sin(divertor_variables.betao - alphad)
+    # zplto = zspo + (build_variables.plleno/2.0e0)*cos(divertor_variables.betao - alphad)
+    # rplbo = build_variables.rspo - (build_variables.plleno/2.0e0)*sin(divertor_variables.betao - alphad)
+    # zplbo = zspo - (build_variables.plleno/2.0e0)*cos(divertor_variables.betao - alphad)
+    half_plleno = plleno / 2.0e0
+    cos_betao = math.cos(betao)
+    sin_betao = math.sin(betao)
+    cos_plate_o = cos_thetao * cos_betao - sin_thetao * sin_betao
+    sin_plate_o = sin_thetao * cos_betao + cos_thetao * sin_betao
+    rplto = rspo - half_plleno * cos_plate_o
+    zplto = zspo + half_plleno * sin_plate_o
+    rplbo = rspo + half_plleno * cos_plate_o
+    zplbo = zspo - half_plleno * sin_plate_o
+
+    divht = max(zplti, zplto) - min(zplbo, zplbi)
+
+    return (
+        divht,
+        rspo,
+        rco,
+        rci,
+        thetao,
+        thetai,
+        rxpt,
+        zxpt,
+        rspi,
+        zspi,
+        zspo,
+        rplti,
+        zplti,
+        rplbi,
+        zplbi,
+        rplto,
+        zplto,
+        rplbo,
+        zplbo,
+    )
+
+
+@numba.njit(
+    "Tuple((float64, float64, boolean, boolean))"
+    "(float64, float64, float64, float64, float64)",
+    cache=True,
+)
+def _fitted_ripple_kernel(n, x, r_plasma_out, r_tf_outboard_mid, ripmax):
+    """Fitted TF ripple (see Build.ripple_amplitude)
+
+    n : number of TF coils
+    x : winding pack to inter-coil toroidal length ratio at the plasma centre
+    r_plasma_out : outboard plasma edge radius (m)
+    r_tf_outboard_mid : radius to the centre of the outboard TF coil leg (m)
+    ripmax : maximum allowed ripple at plasma edge (%)
+
+    Returns the ripple at the plasma edge (%), the TF leg radius giving a
+    ripple of ripmax (m), and whether the fit base or that radius had to be
+    kludged.
+    """
+    # Fitting parameters
+    c1 = 0.875e0 - 0.0557e0 * x
+    c2 = 1.617e0 + 0.0832e0 * x
+    n_minus_c2 = n - c2
+
+    #  Calculated ripple for coil at r_tf_outboard_mid (%)
+    ripple = 100.0e0 * c1 * math.pow(r_plasma_out / r_tf_outboard_mid, n_minus_c2)
+
+    #  Calculated r_tf_outboard_mid to produce a ripple of amplitude ripmax
+    base = 0.01 * ripmax / c1
+    # Avoid potential negative or complex result: kludge base to be
+    # small and positive if required
+    base_kludged = not base > 1e-6
+    if base_kludged:
+        base = 1e-6
+
+    r_tf_outboard_midmin = r_plasma_out / math.pow(base, 1.0 / n_minus_c2)
+
+    radius_kludged = not math.isfinite(r_tf_outboard_midmin)
+    if radius_kludged:
+        r_tf_outboard_midmin = r_plasma_out * 3
+
+    return ripple, r_tf_outboard_midmin, base_kludged, radius_kludged
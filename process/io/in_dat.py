@@ -346,9 +346,10 @@ def get_parameters(data, use_string_values=True):
             # (and not in the exclusion list). Store parameter name and value
             if item not in exclusions and item in data:
                 if item == "fimp":
-                    for k in range(len(data["fimp"].get_value)):
+                    # get_value converts the whole array on every access, so
+                    # only fetch it once
+                    for k, value in enumerate(data["fimp"].get_value):
                         name = f"fimp({str(k + 1).zfill(1)})"
-                        value = data["fimp"].get_value[k]
                         parameters[module][name] = value
 
                 elif item == "ioptimz":
@@ -361,15 +362,13 @@ def get_parameters(data, use_string_values=True):
                     parameters[module][name] = ioptimz
 
                 elif item == "zref":
-                    for j in range(len(data["zref"].get_value)):
+                    for j, value in enumerate(data["zref"].get_value):
                         name = f"zref({str(j + 1).zfill(1)})"
-                        value = data["zref"].get_value[j]
                         parameters[module][name] = value
 
                 elif item == "impurity_enrichment":
-                    for m in range(len(data["impurity_enrichment"].get_value)):
+                    for m, value in enumerate(data["impurity_enrichment"].get_value):
                         name = f"impurity_enrichment({str(m + 1).zfill(1)})"
-                        value = data["impurity_enrichment"].get_value[m]
                         parameters[module][name] = value
 
                 elif "vmec" in item:
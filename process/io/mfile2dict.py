@@ -14,7 +14,7 @@
 import logging
 import os
 import re
-from collections import OrderedDict, abc
+from collections import abc
 from typing import Any
 
 MFILE_END = "# Copy of PROCESS Input Follows #"
@@ -32,7 +32,7 @@ class MFILEParser(abc.MutableMapping):
             MFILE to search, by default ""
         """
         self._input_file = input_mfile
-        self._mfile_data: OrderedDict = OrderedDict()
+        self._mfile_data: dict = {}
         self._logger = logging.getLogger(self.__class__.__name__)
         self._logger.setLevel(logging.INFO)
         if self._input_file:
@@ -87,23 +87,6 @@ class MFILEParser(abc.MutableMapping):
                 return self._mfile_data[group][param_name]["value"]
         raise KeyError(f"No variable '{param_name}' found.")
 
-    def _line_string_search(self, lines: list[str], search_str: str) -> list[int]:
-        """Search for substring in file lines.
-
-        Parameters
-        ----------
-        lines : List[str]
-            list of file lines to search
-        search_str : str
-            search term to look for
-
-        Returns
-        -------
-        List[int]
-            list of indexes for matching lines
-        """
-        return [i for i, line in enumerate(lines) if search_str in line]
-
     def _find_var_val_from_str(self, value_str: str) -> Any:
         """Convert a string variable to float, int etc.
 
@@ -176,8 +159,10 @@ class MFILEParser(abc.MutableMapping):
                         _new_line += element
                 _lines[i] = _new_line[:3]
 
-        # Use an ordered dictionary to match ordering in MFILE
-        _vars_dict = OrderedDict()
+        # Use a plain dictionary (insertion ordered) to match ordering in
+        # MFILE and keep the parsed tree serialisable by JSON, YAML and Pickle
+        # without any conversion
+        _vars_dict = {}
 
         # Iterate through the resultant line sets and tidy them a little
         # finally creating a dictionary entry for each with the required
@@ -223,6 +208,8 @@ class MFILEParser(abc.MutableMapping):
         ------
         FileNotFoundError
             if the input file does not exist
+        ValueError
+            if the input file has no copy of the input file marker
         """
         if not os.path.exists(mfile_addr):
             raise FileNotFoundError(
@@ -232,14 +219,21 @@ class MFILEParser(abc.MutableMapping):
         self._logger.info("Parsing MFILE: %s", mfile_addr)
 
         with open(mfile_addr) as f:
-            _lines = f.readlines()
+            _text = f.read()
+
+        if MFILE_END not in _text:
+            raise ValueError(
+                f"Could not find the end of the output in MFILE '{mfile_addr}',"
+                f" expected a line '{MFILE_END}'."
+            )
 
-        _end_of_output = self._line_string_search(_lines, MFILE_END)[0]
+        # Only the output section is parsed, so drop the copy of the input
+        # file (and the line holding the marker) before splitting into lines
+        _end_of_output = _text.index(MFILE_END)
+        _lines = _text[: max(_text.rfind("\n", 0, _end_of_output), 0)].split("\n")
 
         self._logger.info("Extracting file headers")
-        _header_indexes = [
-            i for i, line in enumerate(_lines) if line.strip() and i < _end_of_output
-        ]
+        _header_indexes = [i for i, line in enumerate(_lines) if line.strip()]
 
         _header_indexes = [
             i
@@ -414,8 +408,11 @@ class MFILEParser(abc.MutableMapping):
             # If file suffix is YAML
             import yaml
 
+            # Prefer the libyaml emitter where PyYAML was built against it
+            _dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
             with open(output_filename, "w") as file:
-                yaml.dump(self._mfile_data, file)
+                yaml.dump(self._mfile_data, file, Dumper=_dumper)
         elif _suffix == ".pckl":
             self._logger.info("Output will be Pickle file.")
             # If file suffix is Pickle
@@ -12,6 +12,31 @@ var is deprecated.
 Note: this is now relied upon by Blueprint, pending implementing a proper API.
 """
 
+kallenbach_list = [
+    "target_spread",
+    "lambda_q_omp",
+    "lcon_factor",
+    "netau_sol",
+    "kallenbach_switch",
+    "kallenbach_tests",
+    "kallenbach_test_option",
+    "kallenbach_scan_switch",
+    "kallenbach_scan_var",
+    "kallenbach_scan_start",
+    "kallenbach_scan_end",
+    "kallenbach_scan_num",
+    "targetangle",
+    "ttarget",
+    "qtargettotal",
+    "impurity_enrichment",
+    "fractionwidesol",
+    "abserr_sol",
+    "relerr_sol",
+    "mach0",
+    "neratio",
+]
+kallenbach_message = "The Kallenbach model is currently not included in PROCESS. See issue #1886 for more information on the use of the Kallenbach model. "
+
 OBS_VARS = {
     "snull": "i_single_null",
     "tfno": "n_tf_coils",
@@ -201,36 +226,11 @@ OBS_VARS = {
     "rli": "ind_plasma_internal_norm",
     "gamma": "ejima_coeff",
     "lpulse": "i_pulsed_plant",
+    **dict.fromkeys(kallenbach_list, None),
 }
 
 OBS_VARS_HELP = {
     "iculdl": "(use IDENSL=3 for equivalent model to ICULDL=0). ",
     "blnktth": "WARNING. BLNKTTH is now always calculated rather than input - please remove it from the input file. ",
+    **dict.fromkeys(kallenbach_list, kallenbach_message),
 }
-
-kallenbach_list = [
-    "target_spread",
-    "lambda_q_omp",
-    "lcon_factor",
-    "netau_sol",
-    "kallenbach_switch",
-    "kallenbach_tests",
-    "kallenbach_test_option",
-    "kallenbach_scan_switch",
-    "kallenbach_scan_var",
-    "kallenbach_scan_start",
-    "kallenbach_scan_end",
-    "kallenbach_scan_num",
-    "targetangle",
-    "ttarget",
-    "qtargettotal",
-    "impurity_enrichment",
-    "fractionwidesol",
-    "abserr_sol",
-    "relerr_sol",
-    "mach0",
-    "neratio",
-]
-kallenbach_message = "The Kallenbach model is currently not included in PROCESS. See issue #1886 for more information on the use of the Kallenbach model. "
-OBS_VARS.update(dict.fromkeys(kallenbach_list, None))
-OBS_VARS_HELP.update(dict.fromkeys(kallenbach_list, kallenbach_message))
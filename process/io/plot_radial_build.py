@@ -20,6 +20,189 @@ import numpy as np
 import process.io.mfile as mf
 from process.io.variable_metadata import var_dicts as meta
 
+# nsweep varible dict
+# -------------------
+# TODO WOULD BE GREAT TO HAVE IT AUTOMATICALLY GENERATED ON THE PROCESS CMAKE!
+#        THE SAME WAY THE DICTS ARE
+# This needs to be kept in sync automatically; this will break frequently
+# otherwise
+# Rem : Some variables are not in the MFILE, making the defintion rather tricky...
+
+_NSWEEP_LIST = (
+    "aspect",
+    "hldivlim",
+    "pnetelmw",
+    "hfact",
+    "oacdcp",
+    "walalw",
+    "beamfus0",
+    "fqval",
+    "te",
+    "boundu(15)",
+    "beta_norm_max",
+    "bootstrap_current_fraction_max",
+    "boundu(10)",
+    "fiooic",
+    "fjprot",
+    "rmajor",
+    "bmaxtf",  # bmxlim the maximum T field upper limit is the scan variable
+    "gammax",
+    "boundl(16)",
+    "cnstv.t_burn_min",
+    "",
+    "cfactr",
+    "boundu(72)",
+    "powfmax",
+    "kappa",
+    "triang",
+    "tbrmin",
+    "bt",
+    "coreradius",
+    "Obsolete",  # Removed
+    "f_alpha_energy_confinement_min",
+    "epsvmc",
+    "ttarget",
+    "qtargettotal",
+    "lambda_q_omp",
+    "lambda_target",
+    "lcon_factor",
+    "boundu(129)",
+    "boundu(131)",
+    "boundu(135)",
+    "dr_blkt_outboard",
+    "fimp(9)",
+    "Obsolete",  # Removed
+    "alstrtf",
+    "tmargmin_tf",
+    "boundu(152)",
+    "impurity_enrichment(9)",
+    "n_pancake",
+    "n_layer",
+    "fimp(13)",
+    "ftar",
+    "rad_fraction_sol",
+    "",
+    "b_crit_upper_nbti",
+    "dr_shld_inboard",
+    "crypmw_max",
+    "bt",  # Genuinly bt lower bound
+    "dr_fw_plasma_gap_inboard",
+    "dr_fw_plasma_gap_outboard",
+    "sig_tf_wp_max",
+    "copperaoh_m2_max",
+    "coheof",
+    "dr_cs",
+    "ohhghf",
+    "csfv.n_cycle_min",
+    "pfv.oh_steel_frac",
+    "csfv.t_crack_vertical",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "",
+    "fvs",  # actaully lower bound fvs
+    "v_plasma_loop_burn",
+    "res_plasma",
+)
+
+# "plasma_res_factor"
+# -------------------
+
+# Radial build components from the centreline outwards, as MFILE variables,
+# plot labels and colours. The order is for tf_in_cs == 0; the first few
+# entries are reordered when the TF coil sits inside the CS bore.
+_RADIAL_VARIABLES = (
+    "dr_bore",
+    "dr_cs",
+    "dr_cs_precomp",
+    "dr_cs_tf_gap",
+    "dr_tf_inboard",
+    "dr_tf_shld_gap",
+    "dr_shld_thermal_inboard",
+    "dr_shld_vv_gap_inboard",
+    "dr_vv_inboard",
+    "dr_shld_inboard",
+    "dr_shld_blkt_gap",
+    "dr_blkt_inboard",
+    "dr_fw_inboard",
+    "dr_fw_plasma_gap_inboard",
+    "rminor",
+    "dr_fw_plasma_gap_outboard",
+    "dr_fw_outboard",
+    "dr_blkt_outboard",
+    "dr_shld_blkt_gap",
+    "dr_vv_outboard",
+    "dr_shld_outboard",
+    "dr_shld_vv_gap_outboard",
+    "dr_shld_thermal_outboard",
+    "dr_tf_shld_gap",
+    "dr_tf_outboard",
+)
+
+_RADIAL_LABELS = (
+    "Machine Bore",
+    "Central Solenoid",
+    "CS precompression",
+    "CS Coil gap",
+    "TF Coil Inboard Leg",
+    "TF Coil gap",
+    "Inboard Thermal Shield",
+    "Gap",
+    "Inboard VV",
+    "Inboard Shield",
+    "Gap",
+    "Inboard Blanket",
+    "Inboard First Wall",
+    "Inboard SOL",
+    "Plasma",
+    "Outboard SOL",
+    "Outboard First Wall",
+    "Outboard Blanket",
+    "Gap",
+    "Outboard VV",
+    "Outboard Shield",
+    "Gap",
+    "Outboard Thermal Shield",
+    "Gap",
+    "TF Coil Outboard Leg",
+)
+
+_RADIAL_COLORS = (
+    "lightgrey",
+    "green",
+    "yellow",
+    "white",
+    "blue",
+    "white",
+    "lime",
+    "white",
+    "dimgrey",
+    "violet",
+    "white",
+    "goldenrod",
+    "steelblue",
+    "orange",
+    "red",
+    "orange",
+    "steelblue",
+    "goldenrod",
+    "white",
+    "dimgrey",
+    "violet",
+    "white",
+    "lime",
+    "white",
+    "blue",
+)
+
+# Row of the plasma, which the tf_in_cs reordering does not move
+_PLASMA_INDEX = _RADIAL_LABELS.index("Plasma")
+
 
 def parse_args(args):
     """Parse supplied arguments.
@@ -75,62 +258,47 @@ def parse_args(args):
     return parser.parse_args(args)
 
 
-def get_radial_build(m_file):
-    isweep = int(m_file.data["isweep"].get_scan(-1))
-    if isweep == 0:
-        isweep = 1
-    else:
-        pass
+def get_converged_scans(m_file):
+    """Scan numbers of the converged (ifail == 1) solutions in an MFILE.
+
+    :param m_file: parsed MFILE
+    :type m_file: MFile
+    :return: 1-based scan numbers of the converged solutions
+    :rtype: numpy.ndarray
+    """
+    isweep = max(int(m_file.data["isweep"].get_scan(-1)), 1)
+    ifail = np.array([m_file.data["ifail"].get_scan(ii + 1) for ii in range(isweep)])
+    return np.flatnonzero(ifail == 1) + 1
+
 
-    radial_labels = [
-        "dr_bore",
-        "dr_cs",
-        "dr_cs_precomp",
-        "dr_cs_tf_gap",
-        "dr_tf_inboard",
-        "dr_tf_shld_gap",
-        "dr_shld_thermal_inboard",
-        "dr_shld_vv_gap_inboard",
-        "dr_vv_inboard",
-        "dr_shld_inboard",
-        "dr_shld_blkt_gap",
-        "dr_blkt_inboard",
-        "dr_fw_inboard",
-        "dr_fw_plasma_gap_inboard",
-        "rminor",
-        "dr_fw_plasma_gap_outboard",
-        "dr_fw_outboard",
-        "dr_blkt_outboard",
-        "dr_shld_blkt_gap",
-        "dr_vv_outboard",
-        "dr_shld_outboard",
-        "dr_shld_vv_gap_outboard",
-        "dr_shld_thermal_outboard",
-        "dr_tf_shld_gap",
-        "dr_tf_outboard",
-    ]
-    if int(m_file.data["tf_in_cs"].get_scan(-1)) == 1:
+def get_radial_build(m_file, tf_in_cs=None):
+    if tf_in_cs is None:
+        tf_in_cs = int(m_file.data["tf_in_cs"].get_scan(-1)) == 1
+
+    radial_labels = list(_RADIAL_VARIABLES)
+    if tf_in_cs:
         radial_labels[1] = "dr_tf_inboard"
         radial_labels[2] = "dr_cs_tf_gap"
         radial_labels[3] = "dr_cs"
         radial_labels[4] = "dr_cs_precomp"
         radial_labels[5] = "dr_tf_shld_gap"
 
-    radial_build = [
-        [m_file.data[rl].get_scan(ii + 1) for rl in radial_labels]
-        for ii in range(isweep)
-        if m_file.data["ifail"].get_scan(ii + 1) == 1
-    ]
+    converged_scans = get_converged_scans(m_file)
 
-    radial_build = np.array(radial_build)
+    # One row per component, one column per converged solution
+    radial_build = np.array(
+        [
+            [variable.get_scan(scan) for scan in converged_scans]
+            for variable in (m_file.data[rl] for rl in radial_labels)
+        ],
+        dtype=float,
+    ).reshape(len(radial_labels), converged_scans.size)
 
     # plasma is 2*rminor
     # Therefore we must count it again
+    radial_build[_PLASMA_INDEX] *= 2.0
 
-    for kk in range(radial_build.shape[0]):
-        radial_build[kk, 14] = 2.0 * radial_build[kk, 14]
-
-    return radial_build.T, radial_build.shape[0]
+    return radial_build, converged_scans.size
 
 
 def main(args=None):
@@ -139,191 +307,35 @@ def main(args=None):
     input_file = str(args.input)
     save_format = str(args.save_format)
 
-    # nsweep varible dict
-    # -------------------
-    # TODO WOULD BE GREAT TO HAVE IT AUTOMATICALLY GENERATED ON THE PROCESS CMAKE!
-    #        THE SAME WAY THE DICTS ARE
-    # This needs to be kept in sync automatically; this will break frequently
-    # otherwise
-    # Rem : Some variables are not in the MFILE, making the defintion rather tricky...
-
-    nsweep_list = [
-        "aspect",
-        "hldivlim",
-        "pnetelmw",
-        "hfact",
-        "oacdcp",
-        "walalw",
-        "beamfus0",
-        "fqval",
-        "te",
-        "boundu(15)",
-        "beta_norm_max",
-        "bootstrap_current_fraction_max",
-        "boundu(10)",
-        "fiooic",
-        "fjprot",
-        "rmajor",
-        "bmaxtf",  # bmxlim the maximum T field upper limit is the scan variable
-        "gammax",
-        "boundl(16)",
-        "cnstv.t_burn_min",
-        "",
-        "cfactr",
-        "boundu(72)",
-        "powfmax",
-        "kappa",
-        "triang",
-        "tbrmin",
-        "bt",
-        "coreradius",
-        "Obsolete",  # Removed
-        "f_alpha_energy_confinement_min",
-        "epsvmc",
-        "ttarget",
-        "qtargettotal",
-        "lambda_q_omp",
-        "lambda_target",
-        "lcon_factor",
-        "boundu(129)",
-        "boundu(131)",
-        "boundu(135)",
-        "dr_blkt_outboard",
-        "fimp(9)",
-        "Obsolete",  # Removed
-        "alstrtf",
-        "tmargmin_tf",
-        "boundu(152)",
-        "impurity_enrichment(9)",
-        "n_pancake",
-        "n_layer",
-        "fimp(13)",
-        "ftar",
-        "rad_fraction_sol",
-        "",
-        "b_crit_upper_nbti",
-        "dr_shld_inboard",
-        "crypmw_max",
-        "bt",  # Genuinly bt lower bound
-        "dr_fw_plasma_gap_inboard",
-        "dr_fw_plasma_gap_outboard",
-        "sig_tf_wp_max",
-        "copperaoh_m2_max",
-        "coheof",
-        "dr_cs",
-        "ohhghf",
-        "csfv.n_cycle_min",
-        "pfv.oh_steel_frac",
-        "csfv.t_crack_vertical",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "",
-        "fvs",  # actaully lower bound fvs
-        "v_plasma_loop_burn",
-        "res_plasma",
-    ]
-
-    # "plasma_res_factor"
-    # -------------------
-
     # Getting the scanned variable name
     m_file = mf.MFile(filename=input_file)
     nsweep_ref = int(m_file.data["nsweep"].get_scan(-1))
-    scan_var_name = "Null" if nsweep_ref == 0 else nsweep_list[nsweep_ref - 1]
-
-    radial_labels = [
-        "Machine Bore",
-        "Central Solenoid",
-        "CS precompression",
-        "CS Coil gap",
-        "TF Coil Inboard Leg",
-        "TF Coil gap",
-        "Inboard Thermal Shield",
-        "Gap",
-        "Inboard VV",
-        "Inboard Shield",
-        "Gap",
-        "Inboard Blanket",
-        "Inboard First Wall",
-        "Inboard SOL",
-        "Plasma",
-        "Outboard SOL",
-        "Outboard First Wall",
-        "Outboard Blanket",
-        "Gap",
-        "Outboard VV",
-        "Outboard Shield",
-        "Gap",
-        "Outboard Thermal Shield",
-        "Gap",
-        "TF Coil Outboard Leg",
-    ]
-    if int(m_file.data["tf_in_cs"].get_scan(-1)) == 1:
+    scan_var_name = "Null" if nsweep_ref == 0 else _NSWEEP_LIST[nsweep_ref - 1]
+
+    tf_in_cs = int(m_file.data["tf_in_cs"].get_scan(-1)) == 1
+    radial_labels = list(_RADIAL_LABELS)
+    radial_color = list(_RADIAL_COLORS)
+    if tf_in_cs:
         radial_labels[1] = "TF Coil Inboard Leg"
         radial_labels[2] = "CS Coil gap"
         radial_labels[3] = "Central Solenoid"
         radial_labels[4] = "CS precompression"
         radial_labels[5] = "TF Coil gap"
-    radial_color = [
-        "lightgrey",
-        "green",
-        "yellow",
-        "white",
-        "blue",
-        "white",
-        "lime",
-        "white",
-        "dimgrey",
-        "violet",
-        "white",
-        "goldenrod",
-        "steelblue",
-        "orange",
-        "red",
-        "orange",
-        "steelblue",
-        "goldenrod",
-        "white",
-        "dimgrey",
-        "violet",
-        "white",
-        "lime",
-        "white",
-        "blue",
-    ]
-    if int(m_file.data["tf_in_cs"].get_scan(-1)) == 1:
         radial_color[1] = "blue"
         radial_color[2] = "white"
         radial_color[3] = "green"
         radial_color[4] = "yellow"
         radial_color[5] = "white"
-    radial_build, num_converged_sol = get_radial_build(m_file)
+    radial_build, _ = get_radial_build(m_file, tf_in_cs)
 
     # Get scan variable data
     if scan_var_name != "Null":
-        nn = 0
-        isweep = int(m_file.data["isweep"].get_scan(-1))
-        scan_points = np.zeros(num_converged_sol)
-        for ii in range(isweep):
-            ifail = m_file.data["ifail"].get_scan(ii + 1)
-            if ifail == 1:
-                scan_points[nn] = m_file.data[scan_var_name].get_scan(ii + 1)
-                nn += 1
+        scan_var = m_file.data[scan_var_name]
+        scan_points = np.array([
+            scan_var.get_scan(scan) for scan in get_converged_scans(m_file)
+        ])
     else:
         scan_points = 1
-    index = []
-    # need a set of checks - remove build parts equal to zero
-    for ll in range(len(radial_build[:, 0])):
-        if radial_build[ll, 0] == 0.0:
-            # note index
-            index = np.append(index, ll)
-
     # Plot settings
     # -------------
     # Plot cosmetic settings
@@ -334,17 +346,16 @@ def main(args=None):
         ind = [y for y, _ in enumerate(scan_points)]
     else:
         pass
-    end_scan = radial_labels.index("Plasma") if args.inboard else len(radial_build)
+    end_scan = _PLASMA_INDEX if args.inboard else len(radial_build)
+    # Each bar starts where the components inside it end
+    lefts = np.zeros_like(radial_build[:end_scan])
+    lefts[1:] = np.cumsum(radial_build[: end_scan - 1], axis=0)
     plt.figure(figsize=(8, 6))
-    for kk in range(len(radial_build[:end_scan, 0])):
-        if kk == 0:
-            lower = np.zeros(len(radial_build[kk, :]))
-        else:
-            lower = lower + radial_build[kk - 1, :]
+    for kk, left in enumerate(lefts):
         plt.barh(
             ind if scan_var_name != "Null" else 0,
             radial_build[kk, :],
-            left=lower,
+            left=left,
             height=0.8,
             label=f"{radial_labels[kk]}"
             + f"\n {radial_build[kk][0]:.3f} m" * args.numbers,
@@ -97,7 +97,7 @@ def run_monte_carlo(args):
     RUN_ID = 0
     mfile_data_set = []
     index_data_set = []
-    outputDataSet = []
+    column_data_set = []
 
     for j in range(config.no_samples):
         print("sample point", j, ":")
@@ -129,20 +129,22 @@ def run_monte_carlo(args):
                     # collect the process solution
                     mfilepath = Path(config.wdir) / "MFILE.DAT"
                     m_file = mf.MFile(mfilepath)
-                    outputDataSet.extend([
-                        m_file.data[item].get_scan(-1) for item in m_file.data
-                    ])
 
                     # Append process data to list of all mfile data
-                    mfile_data_set.append(outputDataSet)
-                    outputDataSet = []
+                    mfile_data_set.append([
+                        variable.get_scan(-1) for variable in m_file.data.values()
+                    ])
+                    column_data_set = list(m_file.data)
 
                     RUN_ID += 1
 
-                else:
-                    print(
-                        f"WARNING: {no_unfeasible:d} non feasible point(s) in sweep! Rerunning!"
-                    )
+                    # niter only bounds the retries of an unfeasible sample
+                    # point, so move on once a solution has been collected
+                    break
+
+                print(
+                    f"WARNING: {no_unfeasible:d} non feasible point(s) in sweep! Rerunning!"
+                )
             else:
                 print("PROCESS has stopped without finishing!")
 
@@ -151,9 +153,6 @@ def run_monte_carlo(args):
 
         config.write_error_summary(j)
 
-    # create list of variables used in MFILE
-    column_data_set = column_data_list(config.wdir)
-
     return mfile_data_set, index_data_set, column_data_set
 
 
@@ -169,10 +168,10 @@ def write_morris_method_output(x, s):
         # create sensistivity indices header
         f.write("Parameter mu mu_star sigma mu_star_conf\n")
         # print the sensistivity indices
-        for i in range(x["num_vars"]):
-            f.write(
-                f"{x['names'][i]} {s['mu'][i]:f} {s['mu_star'][i]:f} {s['sigma'][i]:f} {s['mu_star_conf'][i]:f}\n"
-            )
+        f.writelines(
+            f"{x['names'][i]} {s['mu'][i]:f} {s['mu_star'][i]:f} {s['sigma'][i]:f} {s['mu_star_conf'][i]:f}\n"
+            for i in range(x["num_vars"])
+        )
 
 
 def write_sobol_output(x, s):
@@ -187,27 +186,48 @@ def write_sobol_output(x, s):
         # create first order header
         f.write("Parameter S1 S1_conf ST ST_conf\n")
         # print first order Sobol indices
-        for i in range(x["num_vars"]):
-            f.write(
-                f"{x['names'][i]} {s['S1'][i]:f} {s['S1_conf'][i]:f} {s['ST'][i]:f} {s['ST_conf'][i]:f}\n"
-            )
+        f.writelines(
+            f"{x['names'][i]} {s['S1'][i]:f} {s['S1_conf'][i]:f} {s['ST'][i]:f} {s['ST_conf'][i]:f}\n"
+            for i in range(x["num_vars"])
+        )
+
+
+def run_sample(config, in_dat, names, values):
+    """Runs PROCESS at one sample point and collects the solution
+    :param config: uncertainties configuration
+    :type config: UncertaintiesConfig
+    :param in_dat: input file to vary
+    :type in_dat: InDat
+    :param names: names of the uncertain input variables
+    :type names: list
+    :param values: sampled values of the uncertain input variables
+    :type values: numpy.ndarray
+    :return: mfile_data, column_data, fom (None if the run failed)
+    :rtype: tuple
+    """
+    for name, value in zip(names, values, strict=True):
+        set_variable_in_indat(in_dat, name, value)
 
+    in_dat.write_in_dat(output_filename="IN.DAT")
 
-def column_data_list(working_dir):
-    """Reads the list outputs in MFILE.DAT file
-    :param args: args
-    :return: column_data_set
-    :rtype: list
-    """
-    # CONFIG = UncertaintiesConfig(args.configfile)
-    # CONFIG.setup()
+    # Define path for the input file to run
+    input_path = Path(config.wdir) / "IN.DAT"
+    config.run_process(input_path)
 
-    # find path to MFILE data
-    mfilepath = Path(working_dir) / "MFILE.DAT"
+    mfilepath = Path(config.wdir) / "MFILE.DAT"
     m_file = mf.MFile(mfilepath)
+    mfile_data = [variable.get_scan(-1) for variable in m_file.data.values()]
+
+    # We need to find a way to catch failed runs
+    process_status = m_file.data["ifail"].get_scan(-1)
+    print("ifail =", process_status)
 
-    # read data in MFILE
-    return list(m_file.data)
+    fom = None
+    if process_status == 1.0:
+        # read the figure of merit from the MFILE
+        fom = m_file.data[config.figure_of_merit].get_scan(-1)
+
+    return mfile_data, list(m_file.data), fom
 
 
 def run_morris_method(args):
@@ -221,11 +241,9 @@ def run_morris_method(args):
     config = UncertaintiesConfig(args.configfile)
     config.setup()
 
-    sols = np.array([])
-    fail = np.array([])
     mfile_data_set = []
     index_data_set = []
-    outputDataSet = []
+    column_data_set = []
 
     # Set up the sample needed using latin hypercube scaling
     params_values = morris.sample(
@@ -239,60 +257,38 @@ def run_morris_method(args):
     in_dat = InDat()
 
     run_max = int((config.morris_uncertainties["num_vars"] + 1.0) * config.no_samples)
+    sols = np.empty(run_max)
     for run_id in range(run_max):
         print("run number =", run_id)
-        i = 0
-        for n in config.morris_uncertainties["names"]:
-            set_variable_in_indat(in_dat, n, params_values[run_id][i])
-            i = i + 1
-
-        in_dat.write_in_dat(output_filename="IN.DAT")  # this is from in_dat
-
-        # CONFIG.run_process()
-        # Define path for the input file to run
-        input_path = Path(config.wdir) / "IN.DAT"
-        config.run_process(
-            input_path
-        )  # run_process in uncertaintyconfig or RunProcessConfig
-
-        mfilepath = Path(config.wdir) / "MFILE.DAT"
-        m_file = mf.MFile(mfilepath)
-        outputDataSet.extend([m_file.data[item].get_scan(-1) for item in m_file.data])
+        mfile_data, column_data_set, fom = run_sample(
+            config,
+            in_dat,
+            config.morris_uncertainties["names"],
+            params_values[run_id],
+        )
 
         # Append process data to list of all mfile data
-        mfile_data_set.append(outputDataSet)
-        outputDataSet = []
+        mfile_data_set.append(mfile_data)
 
         # add run to index list
         index_data_set.append(f"run{run_id}")
 
-        # We need to find a way to catch failed runs
-        process_status = m_file.data["ifail"].get_scan(-1)
-        print("ifail =", process_status)
-
-        if process_status == 1.0:
-            # read the figure of merit from the MFILE
-            fom = m_file.data[config.figure_of_merit].get_scan(-1)
-            sols = np.append(sols, fom)
+        if fom is not None:
+            sols[run_id] = fom
         else:
             # if run doesn't converge set fom to previous value
-            fail = np.append(fail, run_id)
             if run_id == 0:
                 # if first run doesn't converge set fom to mean
-                sols = np.append(sols, config.output_mean)
+                sols[run_id] = config.output_mean
             else:
-                sols = np.append(sols, sols[np.size(sols) - 1])
+                sols[run_id] = sols[run_id - 1]
 
     params_sol = morris_method.analyze(config.morris_uncertainties, params_values, sols)
     # np.savetxt("FoM_sol.txt", sols)
-    # np.savetxt("error_log.txt", fail)
 
     # write output file
     write_morris_method_output(config.morris_uncertainties, params_sol)
 
-    # create list of variables used in MFILE
-    column_data_set = column_data_list(config.wdir)
-
     return mfile_data_set, index_data_set, column_data_set
 
 
@@ -307,11 +303,9 @@ def run_sobol_method(args):
     config.setup()
 
     # Setup output arrays
-    sols = np.array([])
-    fail = np.array([])
     mfile_data_set = []
     index_data_set = []
-    outputDataSet = []
+    column_data_set = []
 
     # Generate samples
     params_values = saltelli.sample(
@@ -324,41 +318,27 @@ def run_sobol_method(args):
 
     # find capcost_sols from PROCESS
     run_max = int((config.sobol_uncertainties["num_vars"] + 2.0) * config.no_samples)
+    sols = np.empty(run_max)
     for run_id in range(run_max):
         print("run number =", run_id)
-        i = 0
-        for n in config.sobol_uncertainties["names"]:
-            set_variable_in_indat(in_dat, n, params_values[run_id][i])
-            i = i + 1
-
-        in_dat.write_in_dat(output_filename="IN.DAT")
-
-        # Define path for the input file to run
-        input_path = Path(config.wdir) / "IN.DAT"
-        config.run_process(input_path)
-
-        mfilepath = Path(config.wdir) / "MFILE.DAT"
-        m_file = mf.MFile(mfilepath)
-        outputDataSet.extend([m_file.data[item].get_scan(-1) for item in m_file.data])
+        mfile_data, column_data_set, fom = run_sample(
+            config,
+            in_dat,
+            config.sobol_uncertainties["names"],
+            params_values[run_id],
+        )
 
         # Append process data to list of all mfile data
-        mfile_data_set.append(outputDataSet)
-        outputDataSet = []
+        mfile_data_set.append(mfile_data)
 
         # add run to index list
         index_data_set.append(f"run{run_id}")
 
-        # We need to find a way to catch failed runs
-        process_status = m_file.data["ifail"].get_scan(-1)
-        print("ifail =", process_status)
-
-        if process_status == 1.0:
-            capcost = m_file.data[config.figure_of_merit].get_scan(-1)
-            sols = np.append(sols, capcost)
+        if fom is not None:
+            sols[run_id] = fom
         else:
             # if run doesn't converge use mean fom value
-            fail = np.append(fail, run_id)
-            sols = np.append(sols, config.output_mean)
+            sols[run_id] = config.output_mean
 
     params_sol = sobol.analyze(
         config.sobol_uncertainties, sols, calc_second_order=False, print_to_console=True
@@ -367,9 +347,6 @@ def run_sobol_method(args):
     # write output file
     write_sobol_output(config.sobol_uncertainties, params_sol)
 
-    # create list of variables used in MFILE
-    column_data_set = column_data_list(config.wdir)
-
     return mfile_data_set, index_data_set, column_data_set
 
 
@@ -385,9 +362,6 @@ def main(args=None):
     else:
         print("Uncertainty method not recognised!")
 
-    # create list of variables used in MFILE
-    # column_data_set = column_data_list(args)
-
     df = pd.DataFrame(
         data=mfile_data_set, columns=column_data_set, index=index_data_set
     )
@@ -3,8 +3,11 @@ a remote data repository
 """
 
 import dataclasses
+import json
 import logging
+import os
 import re
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -23,11 +26,23 @@ class TrackedMFile:
 class RegressionTestAssetCollector:
     remote_repository_owner = "timothy-nunn"
     remote_repository_repo = "process-tracking-data"
+    tracked_mfile_pattern = re.compile(r"([a-zA-Z0-9_.]+)_MFILE_([a-z0-9]+)\.DAT")
+    cache_directory = (
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "process-tracking-data"
+    )
 
     def __init__(self) -> None:
+        # one keep-alive connection pool for the API and raw file requests
+        self._session = requests.Session()
         self._hashes = self._git_commit_hashes()
         self._tracked_mfiles = self._get_tracked_mfiles()
 
+        # tracked MFiles of each scenario, newest first
+        self._tracked_mfiles_by_scenario = {}
+        for mf in self._tracked_mfiles:
+            self._tracked_mfiles_by_scenario.setdefault(mf.scenario_name, []).append(mf)
+
     def get_reference_mfile(
         self, scenario_name: str, directory: Path, target_hash: str | None = None
     ):
@@ -51,18 +66,51 @@ class RegressionTestAssetCollector:
         :rtype: Path
         """
         reference_mfile_location = directory / f"ref.{scenario_name}.MFILE.DAT"
-        for mf in self._tracked_mfiles:
-            if (mf.scenario_name == scenario_name and target_hash is None) or (
-                mf.scenario_name == scenario_name and target_hash == mf.hash
-            ):
-                with open(reference_mfile_location, "w") as f:
-                    f.write(requests.get(mf.download_link).content.decode())
+        for mf in self._tracked_mfiles_by_scenario.get(scenario_name, []):
+            if target_hash is None or target_hash == mf.hash:
+                shutil.copyfile(self._get_cached_mfile(mf), reference_mfile_location)
 
                 logger.info(f"Reference MFile found for commit {mf.hash}")
                 return reference_mfile_location
 
         return None
 
+    def _get_cached_mfile(self, mf: TrackedMFile) -> Path:
+        """Returns the local copy of a tracked MFile, downloading it first if it
+        is not already cached.
+
+        A tracked MFile never changes once it has been tracked for a commit, so
+        the cache is keyed by commit hash and scenario and never invalidated.
+
+        :param mf: the tracked MFile to fetch
+        :type mf: TrackedMFile
+
+        :returns: path to the cached MFile
+        :rtype: Path
+        """
+        cached_mfile = self.cache_directory / mf.hash / f"{mf.scenario_name}.MFILE.DAT"
+        if cached_mfile.exists():
+            return cached_mfile
+
+        with self._session.get(mf.download_link, stream=True) as response:
+            # nothing is written to the cache for a failed request
+            response.raise_for_status()
+
+            cached_mfile.parent.mkdir(parents=True, exist_ok=True)
+
+            # download next to the cache entry then rename, so an interrupted
+            # download never leaves a partial MFile in the cache
+            partial_mfile = cached_mfile.with_suffix(f".{os.getpid()}.part")
+            try:
+                with open(partial_mfile, "wb") as f:
+                    f.writelines(response.iter_content(chunk_size=65536))
+                partial_mfile.replace(cached_mfile)
+            except BaseException:
+                partial_mfile.unlink(missing_ok=True)
+                raise
+
+        return cached_mfile
+
     def _git_commit_hashes(self):
         """Returns the list of commit hashes.
 
@@ -71,8 +119,7 @@ class RegressionTestAssetCollector:
         """
         return (
             subprocess.run(
-                'git log --format="%H"',
-                shell=True,
+                ["git", "log", "--format=%H"],
                 capture_output=True,
                 check=True,
             )
@@ -87,10 +134,12 @@ class RegressionTestAssetCollector:
         hashes returned from `_git_commit_hashes`.
         :rtype: list[TrackedMFile]
         """
-        repository_files = requests.get(
-            f"https://api.github.com/repos/"
-            f"{self.remote_repository_owner}/{self.remote_repository_repo}/git/trees/master"
-        ).json()["tree"]
+        repository_files = self._get_repository_tree()
+
+        # position of each commit in the git log, newest first
+        hash_positions = {
+            commit_hash: position for position, commit_hash in enumerate(self._hashes)
+        }
 
         # create a list of tracked MFiles from the list of all files
         # in the remote repository.
@@ -101,15 +150,66 @@ class RegressionTestAssetCollector:
             mfile
             for f in repository_files
             if (mfile := self._get_tracked_mfile(f)) is not None
-            and mfile.hash in self._hashes
+            and mfile.hash in hash_positions
         ]
 
         # order tracked MFiles to match order of the git log
         return sorted(
             tracked_mfiles,
-            key=lambda m: self._hashes.index(m.hash),
+            key=lambda m: hash_positions[m.hash],
+        )
+
+    def _get_repository_tree(self):
+        """Gets the list of files in the remote repository.
+
+        The tree is cached on disk alongside its ETag so that later sessions
+        only make a conditional request, which GitHub answers with
+        304 Not Modified (not counted against the API rate limit) while the
+        remote repository is unchanged.
+
+        :returns: a list of dictionaries representing the files in the remote
+        repository.
+        :rtype: list[dict[str, Any]]
+        """
+        cache_file = self.cache_directory / "tree.json"
+        try:
+            cached = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            cached = None
+
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        response = self._session.get(
+            f"https://api.github.com/repos/"
+            f"{self.remote_repository_owner}/{self.remote_repository_repo}/git/trees/master",
+            headers=headers,
         )
 
+        if cached and response.status_code == 304:
+            return cached["tree"]
+
+        response_json = response.json()
+        tree = response_json["tree"]
+
+        if response_json.get("truncated"):
+            logger.warning(
+                "The remote tree listing was truncated by GitHub, "
+                "some tracked MFiles may not be found"
+            )
+
+        if (etag := response.headers.get("ETag")) is not None:
+            # write next to the cache file then rename, so concurrent sessions
+            # (e.g. xdist workers) never read a partially written tree
+            partial_cache_file = cache_file.with_suffix(f".{os.getpid()}.part")
+            try:
+                self.cache_directory.mkdir(parents=True, exist_ok=True)
+                partial_cache_file.write_text(json.dumps({"etag": etag, "tree": tree}))
+                partial_cache_file.replace(cache_file)
+            except OSError:
+                partial_cache_file.unlink(missing_ok=True)
+                logger.warning(f"Could not cache the remote tree in {cache_file}")
+
+        return tree
+
     def _get_tracked_mfile(self, json_data):
         """Converts JSON data of a file tracked on GitHub into a
         `TrackedMFile`, if appropriate
@@ -122,7 +222,7 @@ class RegressionTestAssetCollector:
         tracked mfile.
         :rtype: TrackedMFile | None
         """
-        rematch = re.match(r"([a-zA-Z0-9_.]+)_MFILE_([a-z0-9]+).DAT", json_data["path"])
+        rematch = self.tracked_mfile_pattern.fullmatch(json_data["path"])
 
         if rematch is None:
             return None
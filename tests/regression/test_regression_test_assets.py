@@ -0,0 +1,303 @@
+"""Tests for the regression test asset collector, using a mocked remote."""
+
+import json
+from typing import Any, NamedTuple
+
+import pytest
+import requests
+from regression_test_assets import RegressionTestAssetCollector
+
+TREE_URL = (
+    "https://api.github.com/repos/timothy-nunn/process-tracking-data/git/trees/master"
+)
+MFILE_URL = (
+    "https://raw.githubusercontent.com/timothy-nunn/process-tracking-data/master/"
+    "large_tokamak_MFILE_abc123.DAT"
+)
+
+
+def make_response(status_code=200, content=b"", headers=None):
+    """Creates a response as requests would return it after reading the body.
+
+    :param status_code: HTTP status code of the response
+    :type status_code: int
+    :param content: body of the response
+    :type content: bytes
+    :param headers: headers of the response
+    :type headers: dict[str, str]
+    :returns: the response
+    :rtype: requests.Response
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = content  # noqa: SLF001
+    response._content_consumed = True  # noqa: SLF001
+    return response
+
+
+def mock_remote(monkeypatch, tmp_path, responses):
+    """Points the asset collector at a temporary cache and answers its requests
+    from `responses` instead of the network.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    :param responses: the response returned for each requested URL
+    :type responses: dict[str, requests.Response]
+    :returns: the URL and keyword arguments of each request made
+    :rtype: list[tuple[str, dict]]
+    """
+    requests_made = []
+
+    def get(self, url, **kwargs):
+        requests_made.append((url, kwargs))
+        return responses[url]
+
+    monkeypatch.setattr(
+        RegressionTestAssetCollector, "cache_directory", tmp_path / "cache"
+    )
+
+    monkeypatch.setattr(
+        RegressionTestAssetCollector,
+        "_git_commit_hashes",
+        lambda self: ["def456", "abc123"],
+    )
+
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    return requests_made
+
+
+class GetReferenceMfileParam(NamedTuple):
+    cached_mfile: Any = None
+
+    remote_mfile: Any = None
+
+    expected_mfile: Any = None
+
+    expected_urls: Any = None
+
+
+@pytest.mark.parametrize(
+    "getreferencemfileparam",
+    (
+        # a reference MFile not yet cached is downloaded into the cache
+        GetReferenceMfileParam(
+            cached_mfile=None,
+            remote_mfile=b"MFILE",
+            expected_mfile=b"MFILE",
+            expected_urls=[TREE_URL, MFILE_URL],
+        ),
+        # a cached reference MFile is copied without being downloaded
+        GetReferenceMfileParam(
+            cached_mfile=b"CACHED",
+            remote_mfile=b"MFILE",
+            expected_mfile=b"CACHED",
+            expected_urls=[TREE_URL],
+        ),
+    ),
+)
+def test_get_reference_mfile(getreferencemfileparam, monkeypatch, tmp_path):
+    """The reference MFile is taken from the cache, downloading it into the
+    cache first if needed, and copied to the requested directory.
+
+    :param getreferencemfileparam: the data used to mock and assert in this test.
+    :type getreferencemfileparam: getreferencemfileparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    """
+    tree = [{"path": "large_tokamak_MFILE_abc123.DAT"}]
+    requests_made = mock_remote(
+        monkeypatch,
+        tmp_path,
+        {
+            TREE_URL: make_response(content=json.dumps({"tree": tree}).encode()),
+            MFILE_URL: make_response(content=getreferencemfileparam.remote_mfile),
+        },
+    )
+
+    cache_entry = tmp_path / "cache" / "abc123"
+    if getreferencemfileparam.cached_mfile is not None:
+        cache_entry.mkdir(parents=True)
+        (cache_entry / "large_tokamak.MFILE.DAT").write_bytes(
+            getreferencemfileparam.cached_mfile
+        )
+
+    reference_mfile = RegressionTestAssetCollector().get_reference_mfile(
+        "large_tokamak", tmp_path
+    )
+
+    assert reference_mfile == tmp_path / "ref.large_tokamak.MFILE.DAT"
+
+    assert reference_mfile.read_bytes() == getreferencemfileparam.expected_mfile
+
+    assert [url for url, _ in requests_made] == getreferencemfileparam.expected_urls
+
+    assert [f.name for f in cache_entry.iterdir()] == ["large_tokamak.MFILE.DAT"]
+
+    assert (
+        cache_entry / "large_tokamak.MFILE.DAT"
+    ).read_bytes() == getreferencemfileparam.expected_mfile
+
+
+def test_get_reference_mfile_failed_download(monkeypatch, tmp_path):
+    """A failed download raises and leaves nothing in the cache.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    """
+    tree = [{"path": "large_tokamak_MFILE_abc123.DAT"}]
+    mock_remote(
+        monkeypatch,
+        tmp_path,
+        {
+            TREE_URL: make_response(content=json.dumps({"tree": tree}).encode()),
+            MFILE_URL: make_response(status_code=404),
+        },
+    )
+
+    collector = RegressionTestAssetCollector()
+
+    with pytest.raises(requests.HTTPError):
+        collector.get_reference_mfile("large_tokamak", tmp_path)
+
+    assert not (tmp_path / "cache").exists()
+
+    assert not (tmp_path / "ref.large_tokamak.MFILE.DAT").exists()
+
+
+class GetRepositoryTreeParam(NamedTuple):
+    cached_tree: Any = None
+
+    status_code: Any = None
+
+    remote_tree: Any = None
+
+    etag: Any = None
+
+    expected_headers: Any = None
+
+    expected_hashes: Any = None
+
+    expected_cached_tree: Any = None
+
+
+@pytest.mark.parametrize(
+    "getrepositorytreeparam",
+    (
+        # without a cached tree the listing is fetched unconditionally and
+        # cached with its ETag
+        GetRepositoryTreeParam(
+            cached_tree=None,
+            status_code=200,
+            remote_tree=[{"path": "large_tokamak_MFILE_abc123.DAT"}],
+            etag='"v1"',
+            expected_headers={},
+            expected_hashes=["abc123"],
+            expected_cached_tree={
+                "etag": '"v1"',
+                "tree": [{"path": "large_tokamak_MFILE_abc123.DAT"}],
+            },
+        ),
+        # a cached tree is revalidated with its ETag and reused on 304
+        GetRepositoryTreeParam(
+            cached_tree={
+                "etag": '"v1"',
+                "tree": [{"path": "large_tokamak_MFILE_abc123.DAT"}],
+            },
+            status_code=304,
+            remote_tree=None,
+            etag=None,
+            expected_headers={"If-None-Match": '"v1"'},
+            expected_hashes=["abc123"],
+            expected_cached_tree={
+                "etag": '"v1"',
+                "tree": [{"path": "large_tokamak_MFILE_abc123.DAT"}],
+            },
+        ),
+        # a changed remote tree replaces the cached tree and ETag
+        GetRepositoryTreeParam(
+            cached_tree={"etag": '"v1"', "tree": []},
+            status_code=200,
+            remote_tree=[
+                {"path": "large_tokamak_MFILE_abc123.DAT"},
+                {"path": "large_tokamak_MFILE_def456.DAT"},
+            ],
+            etag='"v2"',
+            expected_headers={"If-None-Match": '"v1"'},
+            expected_hashes=["def456", "abc123"],
+            expected_cached_tree={
+                "etag": '"v2"',
+                "tree": [
+                    {"path": "large_tokamak_MFILE_abc123.DAT"},
+                    {"path": "large_tokamak_MFILE_def456.DAT"},
+                ],
+            },
+        ),
+    ),
+)
+def test_get_repository_tree(getrepositorytreeparam, monkeypatch, tmp_path):
+    """The remote tree listing is cached alongside its ETag and only fetched
+    again when the remote repository has changed.
+
+    :param getrepositorytreeparam: the data used to mock and assert in this test.
+    :type getrepositorytreeparam: getrepositorytreeparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    """
+    requests_made = mock_remote(
+        monkeypatch,
+        tmp_path,
+        {
+            TREE_URL: make_response(
+                status_code=getrepositorytreeparam.status_code,
+                content=json.dumps({
+                    "tree": getrepositorytreeparam.remote_tree
+                }).encode(),
+                headers=(
+                    {"ETag": getrepositorytreeparam.etag}
+                    if getrepositorytreeparam.etag is not None
+                    else {}
+                ),
+            )
+        },
+    )
+
+    cache_directory = tmp_path / "cache"
+    if getrepositorytreeparam.cached_tree is not None:
+        cache_directory.mkdir()
+        (cache_directory / "tree.json").write_text(
+            json.dumps(getrepositorytreeparam.cached_tree)
+        )
+
+    # the tree is fetched when the collector is created
+    collector = RegressionTestAssetCollector()
+
+    assert requests_made == [
+        (TREE_URL, {"headers": getrepositorytreeparam.expected_headers})
+    ]
+
+    assert [
+        mf.hash
+        for mf in collector._tracked_mfiles_by_scenario["large_tokamak"]  # noqa: SLF001
+    ] == getrepositorytreeparam.expected_hashes
+
+    assert [f.name for f in cache_directory.iterdir()] == ["tree.json"]
+
+    assert (
+        json.loads((cache_directory / "tree.json").read_text())
+        == getrepositorytreeparam.expected_cached_tree
+    )
@@ -305,6 +305,39 @@ def test_ripple_amplitude(rippleamplitudeparam, monkeypatch, build):
     assert flag == pytest.approx(rippleamplitudeparam.expected_flag)
 
 
+def test_ripple_amplitude_logs_every_kludge(monkeypatch, build, caplog):
+    """Repeated ripple evaluations with a kludged fit base must each be logged,
+    even though the fitted ripple is cached.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param build: fixture containing an initialised `Build` object
+    :type build: tests.unit.test_build.build (functional fixture)
+
+    :param caplog: pytest fixture used to capture log records
+    :type caplog: _pytest.logging.LogCaptureFixture
+    """
+    monkeypatch.setattr(physics_variables, "rminor", 2.8677741935483869)
+    monkeypatch.setattr(physics_variables, "rmajor", 8.8901000000000003)
+    monkeypatch.setattr(tfcoil_variables, "i_tf_shape", 1)
+    monkeypatch.setattr(tfcoil_variables, "n_tf_coils", 16)
+    monkeypatch.setattr(tfcoil_variables, "tinstf", 0.0080000000000000019)
+    monkeypatch.setattr(tfcoil_variables, "tfinsgap", 0.01)
+    monkeypatch.setattr(tfcoil_variables, "dr_tf_wp", 0.54261087836601019)
+    monkeypatch.setattr(tfcoil_variables, "thkcas", 0.52465000000000006)
+    monkeypatch.setattr(tfcoil_variables, "casths", 0.05000000000000001)
+    monkeypatch.setattr(tfcoil_variables, "i_tf_sup", 1)
+    monkeypatch.setattr(tfcoil_variables, "i_tf_wp_geom", 0)
+    monkeypatch.setattr(build_variables, "r_tf_inboard_in", 2.9939411851091102)
+
+    # A zero ripple limit gives a zero fit base, which is kludged
+    for _ in range(2):
+        build.ripple_amplitude(ripmax=0.0, r_tf_outboard_mid=14.988874193548387)
+
+    assert caplog.messages.count("base is <= 1e-6. Kludging to 1e-6.") == 2
+
+
 class PortszParam(NamedTuple):
     r_tf_outboard_mid: Any = None
 
@@ -411,3 +444,33 @@ def test_portsz(portszparam, monkeypatch, build):
     assert current_drive_variables.rtanmax == pytest.approx(
         portszparam.expected_rtanmax
     )
+
+
+def test_portsz_logs_every_kludge(monkeypatch, build, caplog):
+    """Repeated port size evaluations with an infinite TF coil width must each
+    be logged, even though the port size geometry is cached.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param build: fixture containing an initialised `Build` object
+    :type build: tests.unit.test_build.build (functional fixture)
+
+    :param caplog: pytest fixture used to capture log records
+    :type caplog: _pytest.logging.LogCaptureFixture
+    """
+    monkeypatch.setattr(build_variables, "r_tf_outboard_mid", 16.519405859443332)
+    monkeypatch.setattr(build_variables, "dr_tf_outboard", 1.208)
+    monkeypatch.setattr(current_drive_variables, "nbshield", 0.5)
+    monkeypatch.setattr(current_drive_variables, "beamwd", 0.57999999999999996)
+    monkeypatch.setattr(current_drive_variables, "frbeam", 1.05)
+    monkeypatch.setattr(physics_variables, "rmajor", 8.8901000000000003)
+    monkeypatch.setattr(tfcoil_variables, "tftort", float("inf"))
+    monkeypatch.setattr(tfcoil_variables, "n_tf_coils", 16)
+
+    for _ in range(2):
+        build.portsz()
+
+    assert caplog.messages.count("a is inf. Kludging to 1e10.") == 2
+    assert "b is inf. Kludging to 1e10." not in caplog.messages
+    assert "d is inf. Kludging to 1e10." not in caplog.messages
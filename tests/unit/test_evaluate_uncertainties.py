@@ -0,0 +1,285 @@
+"""Unit tests for uncertainties/evaluate_uncertainties.py."""
+
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+
+import pytest
+
+from process.io.in_dat import InDat
+from process.io.mfile import MFile, MFileVariable
+from process.io.process_config import UncertaintiesConfig
+from process.uncertainties import evaluate_uncertainties
+
+
+def make_mfile(values):
+    """Creates an MFile holding a single scan of the given values without
+    reading a file.
+
+    :param values: mapping of variable name to its value
+    :type values: dict
+    :return: MFile with one variable per entry of values
+    :rtype: MFile
+    """
+    m_file = MFile(filename=None)
+    for name, value in values.items():
+        variable = MFileVariable(name, name)
+        variable.set_scan(1, value)
+        m_file.data[name] = variable
+    return m_file
+
+
+class RunMonteCarloParam(NamedTuple):
+    no_samples: Any = None
+
+    niter: Any = None
+
+    no_unfeasible: Any = None
+
+    expected_runs: Any = None
+
+    expected_mfile_data_set: Any = None
+
+    expected_index_data_set: Any = None
+
+    expected_column_data_set: Any = None
+
+
+@pytest.mark.parametrize(
+    "runmontecarloparam",
+    (
+        # sample 1 is unfeasible on its first run and feasible on the retry
+        RunMonteCarloParam(
+            no_samples=3,
+            niter=3,
+            no_unfeasible=(0, 1, 0, 0),
+            expected_runs=[0, 1, 1, 2],
+            expected_mfile_data_set=[[0, 1], [1, 1], [2, 1]],
+            expected_index_data_set=["run0", "run1", "run2"],
+            expected_column_data_set=["sample", "ifail"],
+        ),
+        # sample 0 stays unfeasible for all niter runs
+        RunMonteCarloParam(
+            no_samples=2,
+            niter=2,
+            no_unfeasible=(1, 1, 0),
+            expected_runs=[0, 0, 1],
+            expected_mfile_data_set=[[1, 1]],
+            expected_index_data_set=["run0"],
+            expected_column_data_set=["sample", "ifail"],
+        ),
+    ),
+)
+def test_run_monte_carlo(runmontecarloparam, monkeypatch, tmp_path):
+    """Each feasible sample point contributes exactly one row, PROCESS is only
+    rerun for a sample point whose run was unfeasible, and a sample point that
+    stays unfeasible for all niter runs contributes no row.
+
+    :param runmontecarloparam: the data used to mock and assert in this test.
+    :type runmontecarloparam: runmontecarloparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    """
+    sample_points = []
+    runs = []
+    no_unfeasible = iter(runmontecarloparam.no_unfeasible)
+
+    monkeypatch.setattr(UncertaintiesConfig, "__init__", lambda self, _: None)
+
+    monkeypatch.setattr(UncertaintiesConfig, "wdir", str(tmp_path))
+
+    monkeypatch.setattr(
+        UncertaintiesConfig, "no_samples", runmontecarloparam.no_samples
+    )
+
+    monkeypatch.setattr(UncertaintiesConfig, "niter", runmontecarloparam.niter)
+
+    monkeypatch.setattr(UncertaintiesConfig, "no_allowed_unfeasible", 0)
+
+    monkeypatch.setattr(UncertaintiesConfig, "setup", lambda self: None)
+
+    monkeypatch.setattr(UncertaintiesConfig, "checks_before_run", lambda self: None)
+
+    monkeypatch.setattr(UncertaintiesConfig, "set_sample_values", lambda self: None)
+
+    monkeypatch.setattr(
+        UncertaintiesConfig,
+        "go2newsamplepoint",
+        lambda self, sample_index: sample_points.append(sample_index),
+    )
+
+    monkeypatch.setattr(
+        UncertaintiesConfig,
+        "run_process",
+        lambda self, input_path: runs.append(sample_points[-1]),
+    )
+
+    monkeypatch.setattr(
+        UncertaintiesConfig, "write_error_summary", lambda self, sample_index: None
+    )
+
+    monkeypatch.setattr(evaluate_uncertainties, "get_neqns_itervars", lambda: (0, []))
+
+    monkeypatch.setattr(
+        evaluate_uncertainties, "get_variable_range", lambda *_: ([], [])
+    )
+
+    monkeypatch.setattr(evaluate_uncertainties, "check_input_error", lambda **_: None)
+
+    monkeypatch.setattr(evaluate_uncertainties, "process_stopped", lambda: False)
+
+    monkeypatch.setattr(
+        evaluate_uncertainties, "no_unfeasible_mfile", lambda: next(no_unfeasible)
+    )
+
+    # each collected MFILE records the sample point it was produced for
+    monkeypatch.setattr(
+        evaluate_uncertainties.mf,
+        "MFile",
+        lambda _: make_mfile({"sample": runs[-1], "ifail": 1}),
+    )
+
+    mfile_data_set, index_data_set, column_data_set = (
+        evaluate_uncertainties.run_monte_carlo(
+            SimpleNamespace(configfile="config.json")
+        )
+    )
+
+    assert runs == runmontecarloparam.expected_runs
+
+    assert mfile_data_set == runmontecarloparam.expected_mfile_data_set
+
+    assert index_data_set == runmontecarloparam.expected_index_data_set
+
+    assert column_data_set == runmontecarloparam.expected_column_data_set
+
+
+class RunSampleParam(NamedTuple):
+    mfile_values: Any = None
+
+    names: Any = None
+
+    values: Any = None
+
+    expected_set_variables: Any = None
+
+    expected_mfile_data: Any = None
+
+    expected_column_data: Any = None
+
+    expected_fom: Any = None
+
+
+@pytest.mark.parametrize(
+    "runsampleparam",
+    (
+        # a converged run returns the figure of merit, with the MFILE columns
+        # in the same order as the row values
+        RunSampleParam(
+            mfile_values={"ifail": 1.0, "rmajor": 8.0, "capcost": 5000.0},
+            names=["rmajor", "aspect"],
+            values=[8.0, 3.1],
+            expected_set_variables=[("rmajor", 8.0), ("aspect", 3.1)],
+            expected_mfile_data=[1.0, 8.0, 5000.0],
+            expected_column_data=["ifail", "rmajor", "capcost"],
+            expected_fom=5000.0,
+        ),
+        # a run that did not converge still returns its MFILE data, but no
+        # figure of merit
+        RunSampleParam(
+            mfile_values={"capcost": 5000.0, "ifail": 2.0},
+            names=["rmajor"],
+            values=[8.0],
+            expected_set_variables=[("rmajor", 8.0)],
+            expected_mfile_data=[5000.0, 2.0],
+            expected_column_data=["capcost", "ifail"],
+            expected_fom=None,
+        ),
+    ),
+)
+def test_run_sample(runsampleparam, monkeypatch, tmp_path):
+    """Sets the sampled inputs, runs PROCESS once and collects the solution.
+
+    :param runsampleparam: the data used to mock and assert in this test.
+    :type runsampleparam: runsampleparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param tmp_path: temporary path fixture
+    :type tmp_path: Path
+    """
+    set_variables = []
+    written = []
+    runs = []
+
+    monkeypatch.setattr(UncertaintiesConfig, "__init__", lambda self: None)
+
+    monkeypatch.setattr(UncertaintiesConfig, "wdir", str(tmp_path))
+
+    monkeypatch.setattr(UncertaintiesConfig, "figure_of_merit", "capcost")
+
+    monkeypatch.setattr(
+        UncertaintiesConfig,
+        "run_process",
+        lambda self, input_path: runs.append(input_path),
+    )
+
+    monkeypatch.setattr(
+        InDat,
+        "write_in_dat",
+        lambda self, output_filename: written.append(output_filename),
+    )
+
+    monkeypatch.setattr(
+        evaluate_uncertainties,
+        "set_variable_in_indat",
+        lambda _, name, value: set_variables.append((name, value)),
+    )
+
+    monkeypatch.setattr(
+        evaluate_uncertainties.mf,
+        "MFile",
+        lambda _: make_mfile(runsampleparam.mfile_values),
+    )
+
+    mfile_data, column_data, fom = evaluate_uncertainties.run_sample(
+        UncertaintiesConfig(),
+        InDat(filename=None),
+        runsampleparam.names,
+        runsampleparam.values,
+    )
+
+    assert set_variables == runsampleparam.expected_set_variables
+
+    assert written == ["IN.DAT"]
+
+    assert runs == [tmp_path / "IN.DAT"]
+
+    assert mfile_data == runsampleparam.expected_mfile_data
+
+    assert column_data == runsampleparam.expected_column_data
+
+    assert fom == runsampleparam.expected_fom
+
+
+def test_run_sample_names_values_mismatch(monkeypatch):
+    """A mismatch between the uncertain variable names and the sampled values is
+    a configuration error and must not be silently truncated.
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    monkeypatch.setattr(UncertaintiesConfig, "__init__", lambda self: None)
+
+    monkeypatch.setattr(
+        evaluate_uncertainties, "set_variable_in_indat", lambda *_: None
+    )
+
+    with pytest.raises(ValueError, match="zip"):
+        evaluate_uncertainties.run_sample(
+            UncertaintiesConfig(), InDat(filename=None), ["rmajor", "aspect"], [8.0]
+        )
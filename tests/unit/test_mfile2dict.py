@@ -1,7 +1,6 @@
 import json
 import os
 import pickle
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -25,8 +24,8 @@ def read_mfile():
 
 
 @pytest.fixture(scope="module")
-def temporary_dir():
-    return tempfile.mkdtemp()
+def temporary_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("mfile2dict")
 
 
 def test_parser_succeed(read_mfile):
@@ -50,7 +49,7 @@ def test_write_yaml(read_mfile, temporary_dir):
     read_mfile.write(_yml_f)
     assert os.path.exists(_yml_f)
     with open(_yml_f) as file:
-        assert yaml.load(file, Loader=yaml.BaseLoader)
+        assert yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
 
 def test_write_pickle(read_mfile, temporary_dir):
@@ -59,3 +58,10 @@ def test_write_pickle(read_mfile, temporary_dir):
     assert os.path.exists(_pckl_f)
     with open(_pckl_f, "rb") as file:
         assert pickle.load(file)
+
+
+def test_parse_without_input_copy(tmp_path):
+    _mfile = tmp_path / "MFILE.DAT"
+    _mfile.write_text(" # Power Reactor Optimisation Code #\n")
+    with pytest.raises(ValueError, match=str(_mfile)):
+        mfile2dict.MFILEParser(str(_mfile))
@@ -0,0 +1,79 @@
+"""Unit tests for the radial build data gathered by plot_radial_build.py."""
+
+import numpy as np
+import pytest
+
+from process.io import plot_radial_build
+from process.io.mfile import MFile, MFileVariable
+
+# distinct radial build variables, in order of first appearance
+RADIAL_VARIABLES = list(dict.fromkeys(plot_radial_build._RADIAL_VARIABLES))  # noqa: SLF001
+
+
+def make_mfile(scans):
+    """Creates an MFile holding the given scan values without reading a file.
+
+    :param scans: mapping of variable name to its values, one per scan
+    :type scans: dict[str, list]
+    :return: MFile with one variable per entry of scans
+    :rtype: MFile
+    """
+    m_file = MFile(filename=None)
+    for name, values in scans.items():
+        variable = MFileVariable(name, name)
+        for scan, value in enumerate(values, start=1):
+            variable.set_scan(scan, value)
+        m_file.data[name] = variable
+    return m_file
+
+
+@pytest.fixture
+def scan_mfile():
+    """MFile of a four point scan in which only scans 1 and 3 converged.
+
+    Each radial build variable has the value 10 * (index + 1) + scan, where
+    index is its position among the distinct radial build variables, so the
+    variable and scan a value came from can be read off it.
+
+    :return: MFile of the scan
+    :rtype: MFile
+    """
+    scans = {
+        "isweep": [4, 4, 4, 4],
+        "ifail": [1, 2, 1, 6],
+        "tf_in_cs": [0, 0, 0, 0],
+    }
+    for index, name in enumerate(RADIAL_VARIABLES):
+        scans[name] = [10.0 * (index + 1) + scan for scan in range(1, 5)]
+    return make_mfile(scans)
+
+
+def test_get_converged_scans(scan_mfile):
+    """Only the 1-based numbers of the scans with ifail == 1 are returned."""
+    np.testing.assert_array_equal(
+        plot_radial_build.get_converged_scans(scan_mfile), [1, 3]
+    )
+
+
+def test_get_converged_scans_single_run():
+    """A run without a scan (isweep == 0) is treated as a single scan."""
+    m_file = make_mfile({"isweep": [0], "ifail": [1]})
+
+    np.testing.assert_array_equal(plot_radial_build.get_converged_scans(m_file), [1])
+
+
+def test_get_radial_build(scan_mfile):
+    """The radial build has one row per component and one column per converged
+    scan, with the plasma counted twice (2 * rminor)."""
+    radial_build, num_converged = plot_radial_build.get_radial_build(scan_mfile)
+
+    assert num_converged == 2
+    assert radial_build.shape == (len(plot_radial_build._RADIAL_LABELS), 2)  # noqa: SLF001
+
+    # some variables (e.g. gaps) appear on both the inboard and outboard side
+    expected = np.array([
+        [10.0 * (RADIAL_VARIABLES.index(name) + 1) + scan for scan in (1, 3)]
+        for name in plot_radial_build._RADIAL_VARIABLES  # noqa: SLF001
+    ])
+    expected[plot_radial_build._PLASMA_INDEX] *= 2.0  # noqa: SLF001
+    np.testing.assert_array_equal(radial_build, expected)